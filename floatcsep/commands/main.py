@@ -170,6 +170,27 @@ def reproduce(config: str, **kwargs) -> None:
     log.debug("")
 
 
+def _add_flags(parser: argparse.ArgumentParser, default: object) -> None:
+    """
+    Adds the optional flags to a parser. These are accepted both before and after the
+    subcommand, e.g., ``floatcsep -d run <config>`` or ``floatcsep run <config> -d``.
+    """
+    parser.add_argument(
+        "-l", "--logging", action="store_true", default=default, help="Don't log experiment"
+    )
+    parser.add_argument(
+        "-t", "--timestamp", action="store_true", default=default, help="Timestamp results"
+    )
+
+    parser.add_argument(
+        "-d",
+        "--debug",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Set the logging level to DEBUG for console output.",
+    )
+
+
 def floatcsep() -> None:
     """
     Entry point for the floatCSEP command-line interface (CLI).
@@ -190,35 +211,30 @@ def floatcsep() -> None:
         None
     """
     parser = argparse.ArgumentParser(argument_default=argparse.SUPPRESS)
-    parser.add_argument(
-        "func",
-        type=str,
-        choices=["run", "stage", "plot", "reproduce"],
-        help="Run a calculation",
-    )
-    parser.add_argument("config", type=str, help="Experiment Configuration file")
-    parser.add_argument(
-        "-l", "--logging", action="store_true", default=False, help="Don't log experiment"
-    )
-    parser.add_argument(
-        "-t", "--timestamp", action="store_true", default=False, help="Timestamp results"
-    )
-
-    parser.add_argument(
-        "-d",
-        "--debug",
-        action="store_true",
-        help="Set the logging level to DEBUG for console output.",
-    )
+    _add_flags(parser, default=False)
+    subparsers = parser.add_subparsers(dest="command", required=True, help="Run a calculation")
+    commands = {"run": run, "stage": stage, "plot": plot, "reproduce": reproduce}
+    for name, func in commands.items():
+        subparser = subparsers.add_parser(name)
+        subparser.add_argument("config", type=str, help="Experiment Configuration file")
+        if name in ("run", "reproduce"):
+            subparser.add_argument(
+                "-j",
+                "--max-workers",
+                type=int,
+                default=argparse.SUPPRESS,
+                help="Number of tasks (e.g., forecast creations, evaluations) to run "
+                "concurrently. Defaults to running them sequentially.",
+            )
+        # no defaults, so that the flags given before the subcommand are not overwritten
+        _add_flags(subparser, default=argparse.SUPPRESS)
+        subparser.set_defaults(func=func)
     args = parser.parse_args()
 
     if hasattr(args, "debug") and args.debug:
         set_console_log_level("DEBUG")
 
-    try:
-        func = globals()[args.func]
-        args.__delattr__("func")
-
-    except AttributeError:
-        raise AttributeError("Function not implemented")
+    func = args.func
+    args.__delattr__("func")
+    args.__delattr__("command")
     func(**vars(args))
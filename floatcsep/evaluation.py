@@ -1,4 +1,5 @@
 import datetime
+import functools
 import os
 from typing import Dict, Callable, Union, Sequence, List, Any
 
@@ -11,6 +12,12 @@ from floatcsep.infrastructure.registries import ExperimentRegistry
 from floatcsep.utils.helpers import parse_csep_func
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_plot_code(code: str):
+    """Compiles (once per source string) a code snippet given in the plot arguments."""
+    return compile(code, "<plot_args>", "exec")
+
+
 class Evaluation:
     """
     Class representing a Scoring Test, which wraps the evaluation function, its arguments,
@@ -291,10 +298,11 @@ class Evaluation:
                         results = self.read_results(time_str, models)
                         ax = func(results, plot_args=fargs, **fkwargs)
                         if "code" in fargs:
-                            exec(fargs["code"])
+                            exec(_compile_plot_code(fargs["code"]))
                         pyplot.savefig(fig_path, dpi=dpi)
                         if show:
                             pyplot.show()
+                        pyplot.close()
                 # Single model test plots (e.g., test distribution)
                 # todo: handle this more elegantly
                 except AttributeError:
@@ -310,12 +318,13 @@ class Evaluation:
                                 fig_path = registry.get_figure(time_str, fig_name)
                                 ax = func(result, plot_args=fargs, **fkwargs, show=False)
                                 if "code" in fargs:
-                                    exec(fargs["code"])
+                                    exec(_compile_plot_code(fargs["code"]))
                                 fig = ax.get_figure()
                                 fig.savefig(fig_path, dpi=dpi)
 
                                 if show:
                                     pyplot.show()
+                                pyplot.close(fig)
 
             elif self.type in ["sequential", "sequential_comparative", "batch"]:
                 fig_path = registry.get_figure(timewindow[-1], self.name)
@@ -323,21 +332,19 @@ class Evaluation:
                 ax = func(results, plot_args=fargs, **fkwargs)
 
                 if "code" in fargs:
-                    exec(fargs["code"])
+                    exec(_compile_plot_code(fargs["code"]))
                 pyplot.savefig(fig_path, dpi=dpi)
                 if show:
                     pyplot.show()
+                pyplot.close()
 
     def as_dict(self) -> dict:
         """
         Represents an Evaluation instance as a dictionary, which can be serialized and then
         parsed
         """
-        out = {}
-        included = ["model", "ref_model", "func_kwargs"]
-        for k, v in self.__dict__.items():
-            if k in included and v:
-                out[k] = v
+        attrs = self.__dict__
+        out = {k: attrs[k] for k in ("func_kwargs", "ref_model", "model") if attrs.get(k)}
         func_str = f"{self.func.__module__}.{self.func.__name__}"
 
         plot_func_str = []
@@ -1,9 +1,14 @@
+import copy
 import datetime
-import filecmp
+import functools
 import hashlib
+import itertools
+import json
 import logging
+import math
 import os
 import shutil
+from collections import Counter
 from os.path import join, abspath, relpath, dirname, isfile, split, exists
 from typing import Union, List, Dict, Sequence
 
@@ -11,14 +16,23 @@ import numpy
 import yaml
 import scipy
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from floatcsep.evaluation import Evaluation
 from floatcsep.infrastructure.logger import add_fhandler
 from floatcsep.model import Model, TimeDependentModel
 from floatcsep.infrastructure.registries import ExperimentRegistry
-from floatcsep.infrastructure.repositories import ResultsRepository, CatalogRepository
+from floatcsep.infrastructure.repositories import (
+    ResultsRepository,
+    CatalogRepository,
+    _loads_json,
+)
 from floatcsep.utils.helpers import (
     NoAliasLoader,
+    NoAliasDumper,
     read_time_cfg,
     read_region_cfg,
     timewindow2str,
@@ -28,6 +42,170 @@ from floatcsep.infrastructure.engine import Task, TaskGraph
 
 log = logging.getLogger("floatLogger")
 
+_YAML_CACHE: Dict[tuple, object] = {}
+
+# Size of the write buffer of serialized experiment files
+_YML_BUFFER_SIZE = 1 << 16
+
+
+def _load_yaml_cached(path: str) -> object:
+    """
+    Parses a YAML configuration file, re-using a previous parse of the same file if its
+    modification time and size did not change.
+
+    Args:
+        path (str): Absolute path of the YAML file
+
+    Returns:
+        A deep copy of the parsed content, so the cached object cannot be mutated by the caller.
+    """
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    hit = _YAML_CACHE.get(key)
+    if hit is None:
+        with open(path, "r") as file_:
+            hit = yaml.load(file_, NoAliasLoader)
+        _YAML_CACHE[key] = hit
+    return copy.deepcopy(hit)
+
+
+def _json_default(obj: object) -> object:
+    """Encodes the objects not natively supported by the JSON serializers."""
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, numpy.generic):
+        # only reached by the json fallback, since orjson serializes numpy natively
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(obj: dict, filename: str) -> None:
+    """Writes a dictionary into a .json file, encoded with ``orjson`` when installed."""
+    if orjson is not None:
+        with open(filename, "wb") as f_:
+            f_.write(
+                orjson.dumps(
+                    obj,
+                    default=_json_default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
+    else:
+        with open(filename, "w", buffering=_YML_BUFFER_SIZE) as f_:
+            json.dump(obj, f_, indent=2, default=_json_default)
+
+
+def _parse_isodate(date: object) -> object:
+    """Decodes an ISO 8601 date string written by the JSON serializers."""
+    if isinstance(date, str):
+        return datetime.datetime.fromisoformat(date)
+    return date
+
+
+_SIDECAR_DATES = ("start_date", "end_date")
+
+
+def _is_json_faithful(config: dict) -> bool:
+    """
+    Checks whether an experiment configuration is read back from JSON as the same objects
+    that the YAML loader returns. That is, it only holds plain JSON types (string keys and
+    finite floats), apart from naive datetimes in the ``time_config`` dates and time windows,
+    which :func:`_read_yml_sidecar` decodes.
+    """
+    time_config = config.get("time_config")
+    dates = []
+    if isinstance(time_config, dict):
+        dates = [time_config[key] for key in _SIDECAR_DATES if key in time_config]
+        for window in time_config.get("timewindows") or []:
+            if not isinstance(window, list):
+                return False
+            dates.extend(window)
+        excluded = (*_SIDECAR_DATES, "timewindows")
+        config = {
+            **config,
+            "time_config": {i: j for i, j in time_config.items() if i not in excluded},
+        }
+    if not all(type(i) is datetime.datetime and i.tzinfo is None for i in dates):
+        return False
+
+    stack = [config]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            if not all(isinstance(key, str) for key in obj):
+                return False
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+        elif isinstance(obj, float):
+            if not math.isfinite(obj):
+                return False
+        elif not (obj is None or isinstance(obj, (str, int))):
+            return False
+    return True
+
+
+def _write_yml_sidecar(config: dict, config_yml: str) -> None:
+    """
+    Writes the JSON copy of an experiment .yml file, together with the modification time and
+    size of the latter. No copy is kept if the configuration would not be read back
+    faithfully, or cannot be encoded.
+    """
+    sidecar = f"{config_yml}.json"
+    if _is_json_faithful(config):
+        stat = os.stat(config_yml)
+        try:
+            yml_stat = [stat.st_mtime_ns, stat.st_size]
+            _write_json({"yml_stat": yml_stat, "config": config}, sidecar)
+            return
+        except (TypeError, ValueError, OverflowError) as e_:
+            log.debug(f"JSON copy of {config_yml} not written: {e_}")
+    try:
+        os.remove(sidecar)
+    except OSError:
+        pass
+
+
+def _read_yml_sidecar(config_yml: str) -> Union[dict, None]:
+    """
+    Reads the JSON copy of an experiment .yml file, written next to it by
+    :meth:`~floatcsep.experiment.Experiment.to_yml`. JSON decoding is much faster than YAML
+    parsing, but the copy is only used if the modification time and size of the .yml file
+    match those recorded in it (i.e., the .yml file was not edited or replaced afterwards).
+
+    Args:
+        config_yml (str): The path to the .yml file
+
+    Returns:
+        The experiment configuration dictionary, or None if there is no up-to-date copy.
+    """
+    sidecar = f"{config_yml}.json"
+    try:
+        stat = os.stat(config_yml)
+        with open(sidecar, "rb") as file_:
+            sidecar_dict = _loads_json(file_.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(sidecar_dict, dict) or sidecar_dict.get("yml_stat") != [
+        stat.st_mtime_ns,
+        stat.st_size,
+    ]:
+        return None
+
+    _dict = sidecar_dict["config"]
+
+    # dates are serialized as strings in JSON
+    time_config = _dict.get("time_config")
+    if isinstance(time_config, dict):
+        for key in _SIDECAR_DATES:
+            if key in time_config:
+                time_config[key] = _parse_isodate(time_config[key])
+        if time_config.get("timewindows"):
+            time_config["timewindows"] = [
+                [_parse_isodate(i) for i in window] for window in time_config["timewindows"]
+            ]
+    return _dict
+
 
 class Experiment:
     """
@@ -79,7 +257,8 @@ class Experiment:
          (seed, number of simulations, etc.)
         postprocess (dict): Contains the instruction for postprocessing
          (e.g. plot forecasts, catalogs)
-        **kwargs: see Note
+        **kwargs: see Note. Also ``max_workers`` (int), the number of tasks to run
+         concurrently (see :meth:`~floatcsep.experiment.Experiment.run`)
 
     Note:
         Instead of using `time_config` and `region_config`, an Experiment can
@@ -127,8 +306,10 @@ class Experiment:
         self.original_run_dir = kwargs.get("original_rundir", None)
         self.run_dir = rundir
         self.seed = kwargs.get("seed", None)
+        self.max_workers = kwargs.get("max_workers", None)
         self.time_config = read_time_cfg(time_config, **kwargs)
         self.region_config = read_region_cfg(region_config, **kwargs)
+        self._tw_strs = timewindow2str(self.timewindows)
         self.model_config = models if isinstance(models, str) else None
         self.test_config = tests if isinstance(tests, str) else None
 
@@ -177,20 +358,22 @@ class Experiment:
         :attr:`region_config` or :attr:`time_config`. These are: ``start_date``, ``end_date``,
         ``timewindows``, ``horizon``, ``offset``, ``region``, ``magnitudes``, ``mag_min``,
         `mag_max``, ``mag_bin``, ``depth_min`` depth_max .
+
+        Note:
+            Only called when the regular attribute lookup (which already includes the
+            instance ``__dict__``) fails. The configuration keys are looked up in the live
+            :attr:`time_config` and then :attr:`region_config` dictionaries, so that in-place
+            edits of these are visible.
         """
 
-        try:
-            return self.__dict__[item]
-        except KeyError:
+        for config in ("time_config", "region_config"):
             try:
-                return self.time_config[item]
+                return self.__dict__[config][item]
             except KeyError:
-                try:
-                    return self.region_config[item]
-                except KeyError:
-                    raise AttributeError(
-                        f"Experiment '{self.name}'" f" has no attribute '{item}'"
-                    ) from None
+                pass
+        raise AttributeError(
+            f"Experiment '{self.__dict__.get('name')}'" f" has no attribute '{item}'"
+        )
 
     def __dir__(self):
         """Adds the time and region configs keys the to instance scope."""
@@ -216,8 +399,7 @@ class Experiment:
         if isinstance(model_config, str):
             modelcfg_path = self.registry.abs(model_config)
             _dir = self.registry.abs_dir(model_config)
-            with open(modelcfg_path, "r") as file_:
-                config_dict = yaml.load(file_, NoAliasLoader)
+            config_dict = _load_yaml_cached(modelcfg_path)
         elif isinstance(model_config, (dict, list)):
             config_dict = model_config
             _dir = self.registry.workdir
@@ -264,8 +446,8 @@ class Experiment:
 
         # Checks if there is any repeated model.
         names_ = [i.name for i in models]
-        if len(names_) != len(set(names_)):
-            reps = set([i for i in names_ if (sum([j == i for j in names_]) > 1)])
+        reps = {name for name, count in Counter(names_).items() if count > 1}
+        if reps:
             one = not bool(len(reps) - 1)
             log.warning(
                 f'Warning: Model{"s" * (not one)} {reps}'
@@ -277,11 +459,21 @@ class Experiment:
 
         return models
 
+    @property
+    def models(self) -> List[Model]:
+        """
+        Returns the experiment's list of models.
+        """
+        return self._models
+
+    @models.setter
+    def models(self, models: List[Model]) -> None:
+        self._models = models
+        self._models_by_name = {model.name: model for model in reversed(models)}
+
     def get_model(self, name: str) -> Model:
         """Returns a Model by its name string."""
-        for model in self.models:
-            if model.name == name:
-                return model
+        return self._models_by_name.get(name)
 
     def get_test(self, name: str) -> Model:
         """Returns an Evaluation by its name string."""
@@ -313,8 +505,7 @@ class Experiment:
 
         if isinstance(test_config, str):
 
-            with open(self.registry.abs(test_config), "r") as config:
-                config_dict = yaml.load(config, NoAliasLoader)
+            config_dict = _load_yaml_cached(self.registry.abs(test_config))
 
             for eval_dict in config_dict:
                 eval_i = Evaluation.from_dict(eval_dict)
@@ -386,7 +577,10 @@ class Experiment:
         log.info("Setting up experiment's tasks")
 
         # Get the time windows strings
-        tw_strings = timewindow2str(self.timewindows)
+        tw_strings = self._tw_strs
+        # Resolve once the attributes that are shared by all the tasks
+        region = self.region
+        models = self.models
 
         # Prepare the testing catalogs
         task_graph = TaskGraph()
@@ -399,15 +593,24 @@ class Experiment:
             # once all the tasks are defined
 
         # Set up the Forecasts creation
-        for time_i in tw_strings:
-            for model_j in self.models:
-                if isinstance(model_j, TimeDependentModel):
+        for i, time_i in enumerate(tw_strings):
+            for model_j in models:
+                is_td = isinstance(model_j, TimeDependentModel)
+                if is_td:
                     task_tj = Task(
                         instance=self, method="set_input_cat", tstring=time_i, model=model_j
                     )
 
                     task_graph.add(task=task_tj)
-                    # A catalog needs to have been filtered
+                    # The model input catalog is overwritten at each time window, so the
+                    # forecast of the previous window needs to have been created
+                    if i > 0:
+                        task_graph.add_dependency(
+                            task_tj,
+                            dep_inst=model_j,
+                            dep_meth="create_forecast",
+                            dkw=tw_strings[i - 1],
+                        )
 
                 task_ij = Task(
                     instance=model_j,
@@ -417,9 +620,9 @@ class Experiment:
                 )
                 task_graph.add(task=task_ij)
                 # A catalog needs to have been filtered
-                if isinstance(model_j, TimeDependentModel):
+                if is_td:
                     task_graph.add_dependency(
-                        task_ij, dep_inst=self, dep_meth="set_input_cat", dkw=(time_i, model_j)
+                        task_ij, dep_inst=self, dep_meth="set_input_cat", dkw=time_i
                     )
                 task_graph.add_dependency(
                     task_ij, dep_inst=self, dep_meth="set_test_cat", dkw=time_i
@@ -427,52 +630,45 @@ class Experiment:
 
         # Set up the Consistency Tests
         for test_k in self.tests:
-            if test_k.type == "consistency":
-                for time_i in tw_strings:
-                    for model_j in self.models:
-                        task_ijk = Task(
-                            instance=test_k,
-                            method="compute",
-                            timewindow=time_i,
-                            model=model_j,
-                            region=self.region,
-                        )
-                        task_graph.add(task_ijk)
-                        # the forecast needs to have been created
-                        task_graph.add_dependency(
-                            task_ijk, dep_inst=model_j, dep_meth="create_forecast", dkw=time_i
-                        )
+            ref_model = self.get_model(test_k.ref_model)
+            test_type = test_k.type
+            # Binds the arguments shared by all the compute tasks of the test
+            compute = functools.partial(Task, instance=test_k, method="compute", region=region)
+            if test_type == "consistency":
+                for time_i, model_j in itertools.product(tw_strings, models):
+                    task_ijk = compute(
+                        timewindow=time_i,
+                        model=model_j,
+                    )
+                    task_graph.add(task_ijk)
+                    # the forecast needs to have been created
+                    task_graph.add_dependency(
+                        task_ijk, dep_inst=model_j, dep_meth="create_forecast", dkw=time_i
+                    )
             # Set up the Comparative Tests
-            elif test_k.type == "comparative":
-                for time_i in tw_strings:
-                    for model_j in self.models:
-                        task_ik = Task(
-                            instance=test_k,
-                            method="compute",
-                            timewindow=time_i,
-                            model=model_j,
-                            ref_model=self.get_model(test_k.ref_model),
-                            region=self.region,
-                        )
-                        task_graph.add(task_ik)
-                        task_graph.add_dependency(
-                            task_ik, dep_inst=model_j, dep_meth="create_forecast", dkw=time_i
-                        )
-                        task_graph.add_dependency(
-                            task_ik,
-                            dep_inst=self.get_model(test_k.ref_model),
-                            dep_meth="create_forecast",
-                            dkw=time_i,
-                        )
+            elif test_type == "comparative":
+                for time_i, model_j in itertools.product(tw_strings, models):
+                    task_ik = compute(
+                        timewindow=time_i,
+                        model=model_j,
+                        ref_model=ref_model,
+                    )
+                    task_graph.add(task_ik)
+                    task_graph.add_dependency(
+                        task_ik, dep_inst=model_j, dep_meth="create_forecast", dkw=time_i
+                    )
+                    task_graph.add_dependency(
+                        task_ik,
+                        dep_inst=ref_model,
+                        dep_meth="create_forecast",
+                        dkw=time_i,
+                    )
             # Set up the Sequential Scores
-            elif test_k.type == "sequential":
-                for model_j in self.models:
-                    task_k = Task(
-                        instance=test_k,
-                        method="compute",
+            elif test_type == "sequential":
+                for model_j in models:
+                    task_k = compute(
                         timewindow=tw_strings,
                         model=model_j,
-                        region=self.region,
                     )
                     task_graph.add(task_k)
                     for tw_i in tw_strings:
@@ -480,16 +676,12 @@ class Experiment:
                             task_k, dep_inst=model_j, dep_meth="create_forecast", dkw=tw_i
                         )
             # Set up the Sequential_Comparative Scores
-            elif test_k.type == "sequential_comparative":
-                tw_strs = timewindow2str(self.timewindows)
-                for model_j in self.models:
-                    task_k = Task(
-                        instance=test_k,
-                        method="compute",
-                        timewindow=tw_strs,
+            elif test_type == "sequential_comparative":
+                for model_j in models:
+                    task_k = compute(
+                        timewindow=tw_strings,
                         model=model_j,
-                        ref_model=self.get_model(test_k.ref_model),
-                        region=self.region,
+                        ref_model=ref_model,
                     )
                     task_graph.add(task_k)
                     for tw_i in tw_strings:
@@ -498,34 +690,38 @@ class Experiment:
                         )
                         task_graph.add_dependency(
                             task_k,
-                            dep_inst=self.get_model(test_k.ref_model),
+                            dep_inst=ref_model,
                             dep_meth="create_forecast",
                             dkw=tw_i,
                         )
             # Set up the Batch comparative Scores
-            elif test_k.type == "batch":
-                time_str = timewindow2str(self.timewindows[-1])
-                for model_j in self.models:
-                    task_k = Task(
-                        instance=test_k,
-                        method="compute",
+            elif test_type == "batch":
+                time_str = tw_strings[-1]
+                for model_j in models:
+                    task_k = compute(
                         timewindow=time_str,
-                        ref_model=self.models,
+                        ref_model=models,
                         model=model_j,
-                        region=self.region,
                     )
                     task_graph.add(task_k)
-                    for m_j in self.models:
+                    for m_j in models:
                         task_graph.add_dependency(
                             task_k, dep_inst=m_j, dep_meth="create_forecast", dkw=time_str
                         )
 
         self.task_graph = task_graph
 
-    def run(self) -> None:
+    def run(self, max_workers: int = None) -> None:
         """
         Run the task tree.
 
+        Args:
+            max_workers (int): Number of tasks to run concurrently, each as soon as its
+                dependencies are completed. Defaults to the experiment ``max_workers``, or
+                otherwise to running the tasks sequentially.
+                Results of tests that draw random numbers are not reproducible with the
+                experiment ``seed`` when running concurrently.
+
         todo:
          - Cleanup forecast (perhaps add a clean task in self.prepare_tasks,
             after all test had been run for a given forecast)
@@ -537,7 +733,7 @@ class Experiment:
         if self.seed:
             numpy.random.seed(self.seed)
 
-        self.task_graph.run()
+        self.task_graph.run(max_workers=max_workers or self.max_workers)
         log.info("Calculation completed")
         log.debug("Post-run forecast registry")
         self.registry.log_forecast_trees(self.timewindows)
@@ -622,6 +818,11 @@ class Experiment:
     def to_yml(self, filename: str, **kwargs) -> None:
         """
         Serializes the :class:`~floatcsep.experiment.Experiment` instance into a .yml file.
+        A JSON copy is also written as ``{filename}.json``, together with the modification
+        time and size of the .yml file, which
+        :meth:`~floatcsep.experiment.Experiment.from_yml` reads instead of the .yml file while
+        the latter is not modified. The copy is skipped if the configuration holds objects
+        that JSON would not read back as-is.
 
         Note:
             This instance can then be reinstantiated using
@@ -634,13 +835,10 @@ class Experiment:
         Returns:
         """
 
-        class NoAliasDumper(yaml.Dumper):
-            def ignore_aliases(self, data):
-                return True
-
-        with open(filename, "w") as f_:
+        dict_walk = self.as_dict(**kwargs)
+        with open(filename, "w", buffering=_YML_BUFFER_SIZE) as f_:
             yaml.dump(
-                self.as_dict(**kwargs),
+                dict_walk,
                 f_,
                 Dumper=NoAliasDumper,
                 sort_keys=False,
@@ -648,6 +846,23 @@ class Experiment:
                 indent=1,
                 width=70,
             )
+        _write_yml_sidecar(dict_walk, filename)
+
+    def to_json(self, filename: str, **kwargs) -> None:
+        """
+        Serializes the :class:`~floatcsep.experiment.Experiment` instance into a .json file.
+        Faster than :meth:`~floatcsep.experiment.Experiment.to_yml` for large experiments,
+        since the document is encoded with ``orjson`` when it is installed. Dates are written
+        as ISO 8601 strings.
+
+        Args:
+            filename: Name of the file onto which dump the instance
+            **kwargs: Pass to :meth:`~floatcsep.experiment.Experiment.as_dict`
+
+        Returns:
+        """
+
+        _write_json(self.as_dict(**kwargs), filename)
 
     @classmethod
     def from_yml(cls, config_yml: str, repr_dir=None, **kwargs):
@@ -666,26 +881,88 @@ class Experiment:
             An :class:`~floatcsep.experiment.Experiment` class instance
         """
         log.info("Initializing experiment from .yml file")
+
+        # experiment configuration file, or its up-to-date JSON copy
+        _dict = _read_yml_sidecar(config_yml)
+        if _dict is None:
+            with open(config_yml, "r") as yml:
+                _dict = yaml.load(yml.read(), NoAliasLoader)
+
+        return cls._from_config_dict(_dict, config_yml, repr_dir, **kwargs)
+
+    @staticmethod
+    def dump_many(filename: str, experiments: Sequence["Experiment"], **kwargs) -> None:
+        """
+        Serializes many :class:`~floatcsep.experiment.Experiment` instances (e.g., from a
+        parameter sweep) into a single .yml file, as one YAML document per experiment.
+
+        Note:
+            These instances can then be reinstantiated using
+            :meth:`~floatcsep.experiment.Experiment.load_many`
+
+        Args:
+            filename: Name of the file onto which dump the instances
+            experiments: The experiments to serialize
+            **kwargs: Pass to :meth:`~floatcsep.experiment.Experiment.as_dict`
+        """
+
+        with open(filename, "w", buffering=_YML_BUFFER_SIZE) as f_:
+            yaml.dump_all(
+                (exp.as_dict(**kwargs) for exp in experiments),
+                f_,
+                Dumper=NoAliasDumper,
+                sort_keys=False,
+                default_flow_style=False,
+                indent=1,
+                width=70,
+            )
+
+    @classmethod
+    def load_many(cls, config_yml: str, **kwargs) -> List["Experiment"]:
+        """
+        Initializes the experiments of a .yml file written by
+        :meth:`~floatcsep.experiment.Experiment.dump_many`, parsing it at once.
+
+        Args:
+            config_yml (str): The path to the .yml file
+            **kwargs: Pass to each experiment, as in
+             :meth:`~floatcsep.experiment.Experiment.from_yml`
+
+        Returns:
+            A list of :class:`~floatcsep.experiment.Experiment` class instances
+        """
+        log.info("Initializing experiments from .yml file")
         with open(config_yml, "r") as yml:
+            dicts = list(yaml.load_all(yml, NoAliasLoader))
 
-            # experiment configuration file
-            _dict = yaml.load(yml, NoAliasLoader)
-            _dir_yml = dirname(config_yml)
+        return [cls._from_config_dict(_dict, config_yml, **kwargs) for _dict in dicts]
 
-            # Only ABSOLUTE PATH
-            _dict["path"] = abspath(join(_dir_yml, _dict.get("path", "")))
+    @classmethod
+    def _from_config_dict(cls, _dict: dict, config_yml: str, repr_dir=None, **kwargs):
+        """
+        Initializes an experiment from the parsed content of its .yml file, resolving its
+        paths relative to the file location (see
+        :meth:`~floatcsep.experiment.Experiment.from_yml`).
+        """
+        _dir_yml = dirname(config_yml)
 
-            # replaces rundir case reproduce option is used
-            if repr_dir:
-                _dict["original_rundir"] = _dict.get("rundir", "results")
-                _dict["rundir"] = relpath(join(_dir_yml, repr_dir), _dict["path"])
-                _dict["original_config"] = abspath(join(_dict["path"], _dict["config_file"]))
-            else:
+        # Only ABSOLUTE PATH
+        _dict["path"] = abspath(join(_dir_yml, _dict.get("path", "")))
+
+        # replaces rundir case reproduce option is used
+        if repr_dir:
+            _dict["original_rundir"] = _dict.get("rundir", "results")
+            _dict["rundir"] = relpath(join(_dir_yml, repr_dir), _dict["path"])
+            _dict["original_config"] = abspath(join(_dict["path"], _dict["config_file"]))
+        else:
 
-                _dict["rundir"] = _dict.get("rundir", kwargs.pop("rundir", "results"))
-            _dict["config_file"] = relpath(config_yml, _dir_yml)
-            if "logging" in _dict:
-                kwargs.pop("logging")
+            _dict["rundir"] = _dict.get("rundir", kwargs.pop("rundir", "results"))
+        _dict["config_file"] = relpath(config_yml, _dir_yml)
+        if "logging" in _dict:
+            kwargs.pop("logging")
+        # the command-line option takes precedence over the configuration file
+        if "max_workers" in kwargs:
+            _dict.pop("max_workers", None)
 
         return cls(**_dict, **kwargs)
 
@@ -731,7 +1008,7 @@ class ExperimentComparison:
 
     def get_results(self):
 
-        win_orig = timewindow2str(self.original.timewindows)
+        win_orig = self.original._tw_strs
 
         tests_orig = self.original.tests
 
@@ -778,16 +1055,26 @@ class ExperimentComparison:
         return results
 
     @staticmethod
-    def get_hash(filename):
-
-        with open(filename, "rb") as f:
-            bytes_file = f.read()
-            readable_hash = hashlib.sha256(bytes_file).hexdigest()
-        return readable_hash
+    def compare_files(orig_path: str, repr_path: str) -> dict:
+        """
+        Compares an original and a reproduced result file by their hash and byte to byte.
+        Each file is read only once for both comparisons.
+        """
+        with open(orig_path, "rb") as f:
+            bytes_orig = f.read()
+        with open(repr_path, "rb") as f:
+            bytes_repr = f.read()
+
+        return {
+            "hash": (
+                hashlib.sha256(bytes_orig).hexdigest() == hashlib.sha256(bytes_repr).hexdigest()
+            ),
+            "byte2byte": bytes_orig == bytes_repr,
+        }
 
     def get_filecomp(self):
 
-        win_orig = timewindow2str(self.original.timewindows)
+        win_orig = self.original._tw_strs
 
         tests_orig = self.original.tests
 
@@ -804,19 +1091,15 @@ class ExperimentComparison:
                         orig_path = self.original.registry.get_result(tw, test, model)
                         repr_path = self.reproduced.registry.get_result(tw, test, model)
 
-                        results[test.name][tw][model] = {
-                            "hash": (self.get_hash(orig_path) == self.get_hash(repr_path)),
-                            "byte2byte": filecmp.cmp(orig_path, repr_path),
-                        }
+                        results[test.name][tw][model] = self.compare_files(
+                            orig_path, repr_path
+                        )
             else:
                 results[test.name] = dict.fromkeys(models_orig)
                 for model in models_orig:
                     orig_path = self.original.registry.get_result(win_orig[-1], test, model)
                     repr_path = self.reproduced.registry.get_result(win_orig[-1], test, model)
-                    results[test.name][model] = {
-                        "hash": (self.get_hash(orig_path) == self.get_hash(repr_path)),
-                        "byte2byte": filecmp.cmp(orig_path, repr_path),
-                    }
+                    results[test.name][model] = self.compare_files(orig_path, repr_path)
         return results
 
     def compare_results(self):
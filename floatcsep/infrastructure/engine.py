@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Union, Any
 
 
@@ -21,6 +22,10 @@ class Task:
 
     """
 
+    # Experiments create one task per (time window, model, test) combination, so the
+    # per-instance __dict__ is dropped in favour of fixed slots.
+    __slots__ = ("obj", "method", "kwargs", "store")
+
     def __init__(self, instance: object, method: str, **kwargs):
 
         self.obj = instance
@@ -172,18 +177,46 @@ class TaskGraph:
 
         self.tasks[task].extend(deps)
 
-    def run(self):
+    def run(self, max_workers: int = None):
         """
         Executes all tasks in the task graph in the correct order based on dependencies.
 
         Iterates over each task in the graph and runs it after its dependencies have been
-        resolved.
+        resolved. If ``max_workers`` is larger than 1, the tasks are instead dispatched to a
+        thread pool as soon as all of their dependencies have been completed.
+
+        Args:
+            max_workers (int): Number of tasks to run concurrently. Defaults to running the
+                tasks sequentially, in the order they were added.
 
         Returns:
             None
         """
+        if not max_workers or max_workers <= 1:
+            for task, deps in self.tasks.items():
+                task.run()
+            return
+
+        pending = {}
+        dependents = {task: [] for task in self.tasks}
         for task, deps in self.tasks.items():
-            task.run()
+            pending[task] = set(deps)
+            for dep in pending[task]:
+                dependents[dep].append(task)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {
+                executor.submit(task.run): task for task, deps in pending.items() if not deps
+            }
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    future.result()
+                    for child in dependents[task]:
+                        pending[child].discard(task)
+                        if not pending[child]:
+                            running[executor.submit(child.run)] = child
 
     def __call__(self, *args, **kwargs):
         """
@@ -192,4 +225,4 @@ class TaskGraph:
         Returns:
             None
         """
-        return self.run()
+        return self.run(*args, **kwargs)
@@ -1,8 +1,11 @@
+import functools
 import logging
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from os.path import join, abspath, relpath, normpath, dirname, exists
+from os.path import join, abspath, relpath, dirname, exists, isabs
+from sys import intern
 from typing import Sequence, Union, TYPE_CHECKING, Any
 
 from floatcsep.utils.helpers import timewindow2str
@@ -14,23 +17,104 @@ if TYPE_CHECKING:
 log = logging.getLogger("floatLogger")
 
 
+def _debug_handled(logger: logging.Logger) -> bool:
+    """
+    Checks whether a DEBUG record of the logger is emitted by any of its handlers (e.g., the
+    experiment log file), since the console handler is usually set at INFO level while the
+    logger itself is at DEBUG level.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return False
+    while logger:
+        if any(handler.level <= logging.DEBUG for handler in logger.handlers):
+            return True
+        if not logger.propagate:
+            break
+        logger = logger.parent
+    return False
+
+# Maximum number of threads issuing directory-creation calls concurrently
+_MAKEDIRS_WORKERS = 16
+
+# Path separator used to concatenate the internally generated registry paths, which
+# is cheaper than os.path.join
+_SEP = os.sep
+
+
+@functools.lru_cache(maxsize=1024)
+def _window_str(window: tuple) -> str:
+    """Memoized :func:`~floatcsep.utils.helpers.timewindow2str` of a single time window."""
+    return timewindow2str(window)
+
+
+class _FigureTree(dict):
+    """
+    Dictionary of the experiment figure paths, in which the entries of each time window are
+    only built when the window is first accessed, since usually only a few of them are
+    queried. Accessing a window that was not registered raises a KeyError as usual.
+    """
+
+    def __init__(
+        self,
+        windows: Sequence[str] = (),
+        tests: Sequence[str] = (),
+        models: Sequence[str] = (),
+    ) -> None:
+        super().__init__(main_catalog_map="catalog", main_catalog_time="events")
+        self._windows = frozenset(windows)
+        self._tests = tuple(tests)
+        self._models = tuple(models)
+
+    def __missing__(self, win: str) -> dict:
+        if win not in self._windows:
+            raise KeyError(win)
+        fig_dir = f"{win}{_SEP}figures{_SEP}"
+        figures = {
+            **{test: f"{fig_dir}{test}" for test in self._tests},
+            "catalog_map": f"{fig_dir}catalog_map",
+            "catalog_time": f"{fig_dir}catalog_time",
+            "forecasts": {model: f"{fig_dir}forecast_{model}" for model in self._models},
+        }
+        self[win] = figures
+        return figures
+
+
 class FileRegistry(ABC):
 
     def __init__(self, workdir: str) -> None:
         self.workdir = workdir
+        self._path_cache = {}
 
     @staticmethod
     def _parse_arg(arg) -> Union[str, list[str]]:
-        if isinstance(arg, (list, tuple)):
-            return timewindow2str(arg)
+        # Exact types of the common cases are checked first, since they are cheaper than
+        # isinstance; name attributes are then looked up once each with a default.
+        arg_type = type(arg)
+        if arg_type is str:
+            return arg
+        elif arg_type is list or arg_type is tuple or isinstance(arg, (list, tuple)):
+            try:
+                return _window_str(tuple(arg))
+            except TypeError:
+                # sequence of time windows, which cannot be hashed
+                return timewindow2str(arg)
         elif isinstance(arg, str):
             return arg
-        elif hasattr(arg, "name"):
-            return arg.name
-        elif hasattr(arg, "__name__"):
-            return arg.__name__
-        else:
+        name = getattr(arg, "name", None)
+        if name is None:
+            name = getattr(arg, "__name__", None)
+        if name is None:
             raise Exception("Arg is not found")
+        return name
+
+    def _lookup(self, tree: dict, args: Sequence[Any]) -> Any:
+        """
+        Walks down a nested registry dictionary along a sequence of keys. String keys (the
+        usual case) are used as they are; other keys are parsed first.
+        """
+        for i in args:
+            tree = tree[i if type(i) is str else self._parse_arg(i)]
+        return tree
 
     @abstractmethod
     def as_dict(self) -> dict:
@@ -44,13 +128,37 @@ class FileRegistry(ABC):
     def get(self, *args: Sequence[str]) -> Any:
         pass
 
-    def abs(self, *paths: Sequence[str]) -> str:
-        _path = normpath(abspath(join(self.workdir, *paths)))
+    def _resolve(self, kind: str, paths: tuple) -> str:
+        """
+        Resolves a path relative to the working directory, either as an absolute (``"abs"``)
+        or relative (``"rel"``) path. Results are memoized by working directory and path
+        components, since the same paths are looked up repeatedly for every time window,
+        model and test. Paths are only memoized if the working directory is absolute, so the
+        result cannot change with the current directory.
+        """
+        key = (kind, self.workdir, paths)
+        try:
+            return self._path_cache[key]
+        except KeyError:
+            cache = isabs(self.workdir)
+        except TypeError:
+            # unhashable path components
+            cache = False
+
+        # abspath already normalizes the joined path (and only queries the current directory
+        # if the working directory is relative)
+        _path = abspath(join(self.workdir, *paths))
+        if kind == "rel":
+            _path = relpath(_path, self.workdir)
+        if cache:
+            self._path_cache[key] = _path
         return _path
 
+    def abs(self, *paths: Sequence[str]) -> str:
+        return self._resolve("abs", paths)
+
     def abs_dir(self, *paths: Sequence[str]) -> str:
-        _path = normpath(abspath(join(self.workdir, *paths)))
-        _dir = dirname(_path)
+        _dir = dirname(self._resolve("abs", paths))
         return _dir
 
     def rel(self, *paths: Sequence[str]) -> str:
@@ -59,9 +167,7 @@ class FileRegistry(ABC):
         the experiment working dir.
         """
 
-        _abspath = normpath(abspath(join(self.workdir, *paths)))
-        _relpath = relpath(_abspath, self.workdir)
-        return _relpath
+        return self._resolve("rel", paths)
 
     def rel_dir(self, *paths: Sequence[str]) -> str:
         """Gets the absolute path of a file, when it was defined relative to.
@@ -69,11 +175,22 @@ class FileRegistry(ABC):
         the experiment working dir.
         """
 
-        _path = normpath(abspath(join(self.workdir, *paths)))
-        _dir = dirname(_path)
+        _dir = dirname(self._resolve("abs", paths))
 
         return relpath(_dir, self.workdir)
 
+    @staticmethod
+    def _list_folder(folder: str) -> frozenset:
+        """
+        Returns the names of the entries within a folder (empty if it does not exist), so
+        the existence of many files in the same folder is checked with a single scan.
+        """
+        try:
+            with os.scandir(folder) as entries:
+                return frozenset(entry.name for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            return frozenset()
+
     def file_exists(self, *args: Sequence[str]):
         file_abspath = self.get(*args)
         return exists(file_abspath)
@@ -121,10 +238,7 @@ class ForecastRegistry(FileRegistry):
             (usually time-window strings)
         """
 
-        val = self.__dict__
-        for i in args:
-            parsed_arg = self._parse_arg(i)
-            val = val[parsed_arg]
+        val = self._lookup(self.__dict__, args)
         return self.abs(val)
 
     def get_forecast(self, *args: Sequence[str]) -> str:
@@ -188,10 +302,12 @@ class ForecastRegistry(FileRegistry):
         Returns:
             A list of bool representing the existence of such forecasts.
         """
+        # The forecast paths are looked up directly, instead of walking the registry keys
+        forecasts = self.forecasts
         if isinstance(timewindow, str):
-            return self.file_exists("forecasts", timewindow)
+            return exists(self.abs(forecasts[timewindow]))
         else:
-            return [self.file_exists("forecasts", i) for i in timewindow]
+            return [exists(self.abs(forecasts[self._parse_arg(i)])) for i in timewindow]
 
     def build_tree(
         self,
@@ -234,20 +350,28 @@ class ForecastRegistry(FileRegistry):
                 os.makedirs(folder_, exist_ok=True)
 
             # set forecast names
-            self.forecasts = {
-                win: join(dirtree["forecasts"], f"{prefix}_{win}.csv") for win in windows
-            }
+            forecast_dir = f"{dirtree['forecasts']}{_SEP}"
+            self.forecasts = {win: f"{forecast_dir}{prefix}_{win}.csv" for win in windows}
 
     def log_tree(self) -> None:
         """
         Logs a grouped summary of the forecasts' dictionary.
         Groups time windows by whether the forecast exists or not.
         """
+        # The folders are only scanned if the summary is going to be logged
+        if not _debug_handled(log):
+            return
+
         exists_group = []
         not_exist_group = []
+        # Existing files are listed once per forecast folder, instead of checked one by one
+        folder_files = {}
 
         for timewindow, filepath in self.forecasts.items():
-            if self.forecast_exists(timewindow):
+            folder, filename = os.path.split(self.abs(filepath))
+            if folder not in folder_files:
+                folder_files[folder] = self._list_folder(folder)
+            if filename in folder_files[folder]:
                 exists_group.append(timewindow)
             else:
                 not_exist_group.append(timewindow)
@@ -277,7 +401,7 @@ class ExperimentRegistry(FileRegistry):
         self.run_dir = run_dir
         self.results = {}
         self.test_catalogs = {}
-        self.figures = {}
+        self.figures = _FigureTree()
 
         self.repr_config = "repr_config.yml"
         self.forecast_registries = {}
@@ -308,6 +432,9 @@ class ExperimentRegistry(FileRegistry):
         """
         Logs the forecasts for all models managed by this ExperimentRegistry.
         """
+        if not _debug_handled(log):
+            return
+
         log.debug("===================")
         log.debug(f" Total Time Windows: {len(timewindows)}")
         for model_name, registry in self.forecast_registries.items():
@@ -324,10 +451,7 @@ class ExperimentRegistry(FileRegistry):
             The filepath from a sequence of key values (usually models first, then time-window
             strings)
         """
-        val = self.__dict__
-        for i in args:
-            parsed_arg = self._parse_arg(i)
-            val = val[parsed_arg]
+        val = self._lookup(self.__dict__, args)
         return self.abs(self.run_dir, val)
 
     def get_result(self, *args: Sequence[any]) -> str:
@@ -340,10 +464,7 @@ class ExperimentRegistry(FileRegistry):
         Returns:
             The filepath of a serialized result
         """
-        val = self.results
-        for i in args:
-            parsed_arg = self._parse_arg(i)
-            val = val[parsed_arg]
+        val = self._lookup(self.results, args)
         return self.abs(self.run_dir, val)
 
     def get_test_catalog(self, *args: Sequence[any]) -> str:
@@ -356,10 +477,7 @@ class ExperimentRegistry(FileRegistry):
         Returns:
             The filepath of the testing catalog for a given time-window
         """
-        val = self.test_catalogs
-        for i in args:
-            parsed_arg = self._parse_arg(i)
-            val = val[parsed_arg]
+        val = self._lookup(self.test_catalogs, args)
         return self.abs(self.run_dir, val)
 
     def get_figure(self, *args: Sequence[any]) -> str:
@@ -372,10 +490,7 @@ class ExperimentRegistry(FileRegistry):
         Returns:
             The filepath of the figure for a given result
         """
-        val = self.figures
-        for i in args:
-            parsed_arg = self._parse_arg(i)
-            val = val[parsed_arg]
+        val = self._lookup(self.figures, args)
         return self.abs(self.run_dir, val)
 
     def result_exist(self, timewindow_str: str, test_name: str, model_name: str) -> bool:
@@ -388,7 +503,8 @@ class ExperimentRegistry(FileRegistry):
             model_name (str): Name of the model
 
         """
-        return self.file_exists("results", timewindow_str, test_name, model_name)
+        result_path = self.results[timewindow_str][test_name][model_name]
+        return exists(self.abs(self.run_dir, result_path))
 
     def as_dict(self) -> str:
         # todo: rework
@@ -409,53 +525,38 @@ class ExperimentRegistry(FileRegistry):
             tests: List of tests or test names
 
         """
-        windows = timewindow2str(timewindows)
+        # Keys are interned, so the many lookups by window/test/model name compare by identity
+        windows = [intern(win) for win in timewindow2str(timewindows)]
 
-        models = [i.name for i in models]
-        tests = [i.name for i in tests]
+        models = [intern(i.name) for i in models]
+        tests = [intern(i.name) for i in tests]
 
-        run_folder = self.run_dir
-        subfolders = ["catalog", "evaluations", "figures"]
-        dirtree = {
-            win: {folder: self.abs(run_folder, win, folder) for folder in subfolders}
-            for win in windows
-        }
+        results = {}
+        test_catalogs = {}
+        folders = set()
 
-        # create directories if they don't exist
-        for tw, tw_folder in dirtree.items():
-            for _, folder_ in tw_folder.items():
-                os.makedirs(folder_, exist_ok=True)
+        # The folders of each time window are joined once, and then shared by all of its
+        # result entries. Figure paths are only built when a window's figures are accessed
+        for win in windows:
+            cat_dir = f"{win}{_SEP}catalog"
+            eval_dir = f"{win}{_SEP}evaluations"
+            fig_dir = f"{win}{_SEP}figures"
+            folders.update(self.abs(self.run_dir, i) for i in (cat_dir, eval_dir, fig_dir))
 
-        results = {
-            win: {
-                test: {
-                    model: join(win, "evaluations", f"{test}_{model}.json") for model in models
-                }
+            results[win] = {
+                test: {model: f"{eval_dir}{_SEP}{test}_{model}.json" for model in models}
                 for test in tests
             }
-            for win in windows
-        }
-        test_catalogs = {win: join(win, "catalog", "test_catalog.json") for win in windows}
+            test_catalogs[win] = f"{cat_dir}{_SEP}test_catalog.json"
 
-        figures = {
-            "main_catalog_map": "catalog",
-            "main_catalog_time": "events",
-            **{
-                win: {
-                    **{test: join(win, "figures", f"{test}") for test in tests},
-                    "catalog_map": join(win, "figures", "catalog_map"),
-                    "catalog_time": join(win, "figures", "catalog_time"),
-                    "forecasts": {
-                        model: join(win, "figures", f"forecast_{model}") for model in models
-                    },
-                }
-                for win in windows
-            },
-        }
+        # create directories if they don't exist. The calls are issued concurrently to hide
+        # the latency of (network) filesystems
+        with ThreadPoolExecutor(max_workers=_MAKEDIRS_WORKERS) as executor:
+            list(executor.map(lambda folder_: os.makedirs(folder_, exist_ok=True), folders))
 
         self.results = results
         self.test_catalogs = test_catalogs
-        self.figures = figures
+        self.figures = _FigureTree(windows, tests, models)
 
     def log_results_tree(self):
         """
@@ -463,9 +564,15 @@ class ExperimentRegistry(FileRegistry):
         For each test and time window, it logs whether all models have results,
         or if some results are missing, and specifies which models are missing.
         """
+        # The folders are only scanned if the summary is going to be logged
+        if not _debug_handled(log):
+            return
+
         log.debug("===================")
 
         total_results = results_exist_count = results_not_exist_count = 0
+        # Existing files are listed once per results folder, instead of checked one by one
+        folder_files = {}
 
         # Get all unique test names and sort them
         all_tests = sorted(
@@ -482,7 +589,10 @@ class ExperimentRegistry(FileRegistry):
                     for model_name, result_path in models.items():
                         total_results += 1
                         result_full_path = self.get_result(timewindow, test_name, model_name)
-                        if os.path.exists(result_full_path):
+                        folder, filename = os.path.split(result_full_path)
+                        if folder not in folder_files:
+                            folder_files[folder] = self._list_folder(folder)
+                        if filename in folder_files[folder]:
                             results_exist_count += 1
                         else:
                             results_not_exist_count += 1
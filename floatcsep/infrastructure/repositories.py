@@ -1,9 +1,12 @@
+import copy
 import datetime
 import json
 import logging
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from os.path import isfile, exists
-from typing import Sequence, Union, List, TYPE_CHECKING, Callable
+from typing import Sequence, Union, List, TYPE_CHECKING, Callable, Dict
 
 import csep
 import numpy
@@ -17,13 +20,98 @@ from floatcsep.infrastructure.registries import ForecastRegistry, ExperimentRegi
 from floatcsep.utils.helpers import str2timewindow, parse_csep_func
 from floatcsep.utils.helpers import timewindow2str
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 log = logging.getLogger("floatLogger")
 
+# Maximum number of threads reading result files concurrently
+_READ_WORKERS = 16
+
 if TYPE_CHECKING:
     from floatcsep.evaluation import Evaluation
     from floatcsep.model import Model
 
 
+# Deserialized evaluation results, by (path, modification time, size) of their file
+_RESULT_CACHE: Dict[tuple, EvaluationResult] = {}
+_RESULT_CACHE_SIZE = 4096
+
+
+def _load_evaluation_result(key: tuple) -> EvaluationResult:
+    """
+    Deserializes an evaluation result file, given its ``(path, mtime_ns, size)``. The file
+    modification time and size are part of the cache key, so a result that is re-written is
+    read again from disk.
+    """
+    try:
+        return _RESULT_CACHE[key]
+    except KeyError:
+        pass
+    with open(key[0], "rb") as file_:
+        result = EvaluationResult.from_dict(_loads_json(file_.read()))
+    if len(_RESULT_CACHE) >= _RESULT_CACHE_SIZE:
+        # drop the oldest entry
+        _RESULT_CACHE.pop(next(iter(_RESULT_CACHE)), None)
+    _RESULT_CACHE[key] = result
+    return result
+
+
+def _loads_json(data: bytes) -> object:
+    """
+    Decodes a json document with ``orjson`` when it is installed. Documents with the
+    non-standard ``NaN``/``Infinity`` tokens written by :mod:`json` (e.g., undefined test
+    statistics) are rejected by ``orjson``, and are decoded with :mod:`json` instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _write_catalog_json(catalog: CSEPCatalog, filename: str) -> None:
+    """
+    Writes a catalog to a json file readable by :meth:`CSEPCatalog.load_json`. Equivalent to
+    :meth:`CSEPCatalog.write_json`, but the event rows are built from the catalog columns at
+    once and the document is encoded with ``orjson`` when it is installed.
+    """
+    catalog_dict = {}
+    for key, value in catalog.__dict__.items():
+        if callable(value) or key == "_catalog":
+            continue
+        if hasattr(value, "to_dict"):
+            value = value.to_dict()
+        catalog_dict[key[1:] if key.startswith("_") else key] = value
+
+    events = catalog.catalog
+    columns = []
+    for field in events.dtype.names:
+        column = events[field]
+        if column.dtype.kind == "S":
+            column = numpy.char.decode(column, "utf-8")
+        columns.append(column.tolist())
+    catalog_dict["catalog"] = list(zip(*columns))
+
+    if orjson is not None:
+        with open(filename, "wb") as file_:
+            file_.write(
+                orjson.dumps(
+                    catalog_dict,
+                    default=str,
+                    option=orjson.OPT_SORT_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_PASSTHROUGH_DATETIME,
+                )
+            )
+    else:
+        with open(filename, "w") as file_:
+            json.dump(catalog_dict, file_, sort_keys=True, default=str)
+
+
 class ForecastRepository(ABC):
 
     @abstractmethod
@@ -194,6 +282,15 @@ class GriddedForecastRepository(ForecastRepository):
 
         rates, region, mags = f_parser(f_path)
 
+        # The parsed rates are scaled once, in place. GriddedForecast.scale() is lazy instead,
+        # and re-multiplies the whole rates array on every access to forecast.data
+        scale = time_horizon / fc_unit
+        if scale != 1.0:
+            if rates.dtype.kind == "f" and rates.flags.writeable:
+                rates *= scale
+            else:
+                rates = rates * scale
+
         forecast_ = GriddedForecast(
             name=f"{name_}",
             data=rates,
@@ -203,10 +300,6 @@ class GriddedForecastRepository(ForecastRepository):
             end_time=end_date,
         )
 
-        scale = time_horizon / fc_unit
-        if scale != 1.0:
-            forecast_ = forecast_.scale(scale)
-
         log.debug(
             f"\tForecast expected count: {forecast_.event_count:.2f}"
             f" with scaling parameter: {scale:.1f}"
@@ -231,24 +324,31 @@ class ResultsRepository:
         """
         self.registry = registry
 
-    def _load_result(
+    def _result_key(
         self,
         test: "Evaluation",
         window: Union[str, Sequence[datetime.datetime]],
         model: "Model",
-    ) -> EvaluationResult:
-
+    ) -> tuple:
+        """Returns the ``(path, mtime_ns, size)`` cache key of a result file."""
         if not isinstance(window, str):
             wstr_ = timewindow2str(window)
         else:
             wstr_ = window
 
         eval_path = self.registry.get_result(wstr_, test, model)
+        stat = os.stat(eval_path)
+
+        return eval_path, stat.st_mtime_ns, stat.st_size
 
-        with open(eval_path, "r") as file_:
-            model_eval = EvaluationResult.from_dict(json.load(file_))
+    def _load_result(
+        self,
+        test: "Evaluation",
+        window: Union[str, Sequence[datetime.datetime]],
+        model: "Model",
+    ) -> EvaluationResult:
 
-        return model_eval
+        return _load_evaluation_result(self._result_key(test, window, model))
 
     def load_results(
         self,
@@ -267,11 +367,15 @@ class ResultsRepository:
         """
 
         if isinstance(models, list):
-            test_results = []
-            for model in models:
-                model_eval = self._load_result(test, window, model)
-                test_results.append(model_eval)
-            return test_results
+            keys = [self._result_key(test, window, model) for model in models]
+            # Files not cached yet are read concurrently, so their I/O waits overlap. A pool
+            # is only started if there are several of them.
+            misses = [key for key in dict.fromkeys(keys) if key not in _RESULT_CACHE]
+            if len(misses) > 1:
+                n_workers = min(len(misses), _READ_WORKERS)
+                with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                    list(executor.map(_load_evaluation_result, misses))
+            return [_load_evaluation_result(key) for key in keys]
         else:
             return self._load_result(test, window, models)
 
@@ -320,6 +424,12 @@ class CatalogRepository:
         """
         self.cat_path = None
         self._catalog = None
+        self._cached_catalog = None
+        self._cached_key = None
+        self._region_mask = None
+        self._region_mask_src = None
+        self._test_cats = {}
+        self._test_cats_src = None
         self.registry = registry
         self.time_config = {}
         self.region_config = {}
@@ -379,10 +489,11 @@ class CatalogRepository:
 
         if callable(self._catalog):
             if isfile(self.cat_path):
-                return CSEPCatalog.load_json(self.cat_path)
+                return self._load_cached(self.cat_path, CSEPCatalog.load_json)
+            timewindows = numpy.array(self.timewindows, dtype="datetime64[us]")
             bounds = {
-                "start_time": min([item for sublist in self.timewindows for item in sublist]),
-                "end_time": max([item for sublist in self.timewindows for item in sublist]),
+                "start_time": timewindows.min().astype(datetime.datetime),
+                "end_time": timewindows.max().astype(datetime.datetime),
                 "min_magnitude": self.magnitudes.min(),
                 "max_depth": self.depths.max(),
             }
@@ -402,19 +513,27 @@ class CatalogRepository:
             if self.region:
                 catalog.filter_spatial(region=self.region, in_place=True)
                 catalog.region = None
-            catalog.write_json(self.cat_path)
+            _write_catalog_json(catalog, self.cat_path)
 
             return catalog
 
         elif isfile(cat_path):
-            try:
-                return CSEPCatalog.load_json(cat_path)
-            except json.JSONDecodeError:
-                return csep.load_catalog(cat_path)
+
+            def loader(path):
+                try:
+                    return CSEPCatalog.load_json(path)
+                except json.JSONDecodeError:
+                    return csep.load_catalog(path)
+
+            return self._load_cached(cat_path, loader)
 
     @catalog.setter
     def catalog(self, cat: Union[Callable, CSEPCatalog, str]) -> None:
 
+        self._cached_catalog = None
+        self._cached_key = None
+        self._test_cats_src = None
+
         if cat is None:
             self._catalog = None
             self.cat_path = None
@@ -433,6 +552,43 @@ class CatalogRepository:
             else:
                 log.info(f"\tCatalog: '{cat}'")
 
+    @staticmethod
+    def _file_key(path: str) -> tuple:
+        stat = os.stat(path)
+        return path, stat.st_mtime_ns, stat.st_size
+
+    def _load_cached(self, path: str, loader: Callable) -> CSEPCatalog:
+        """
+        Returns the catalog stored at ``path``, reading it from disk only if the file has
+        changed since the last access.
+
+        Args:
+            path (str): Path to the stored catalog
+            loader (callable): Function that reads the catalog from ``path``
+        """
+        key = self._file_key(path)
+        if self._cached_key != key:
+            self._cached_catalog = loader(path)
+            self._cached_key = key
+        return self._cached_catalog
+
+    def _spatial_mask(self, catalog: CSEPCatalog) -> numpy.ndarray:
+        """
+        Returns the boolean mask of the catalog events located within the experiment region.
+        The mask is computed once per catalog/region pair, so that every time window reuses
+        it instead of re-binning the event coordinates into the region grid.
+
+        Args:
+            catalog (CSEPCatalog): The catalog whose events are located
+        """
+        src = self._region_mask_src
+        if src is None or src[0] is not catalog or src[1] is not self.region:
+            self._region_mask = ~self.region.get_masked(
+                catalog.get_longitudes(), catalog.get_latitudes()
+            )
+            self._region_mask_src = (catalog, self.region)
+        return self._region_mask
+
     def get_test_cat(self, tstring: str = None) -> CSEPCatalog:
         """
         Filters the complete experiment catalog to a test sub-catalog bounded by the test
@@ -442,25 +598,71 @@ class CatalogRepository:
             tstring (str): Time window string
         """
 
-        if tstring:
-            start, end = str2timewindow(tstring)
-        else:
-            start = self.start_date
-            end = self.end_date
+        catalog = self.catalog
+        if self._test_cats_src is not catalog:
+            self._test_cats = {}
+            self._test_cats_src = catalog
+
+        # The sub-catalog of each window is filtered once. Callers get a shallow copy that
+        # shares the event records, so they can re-assign its region (e.g. to the forecast's)
+        # without affecting other evaluations.
+        test_cat = self._test_cats.get(tstring)
+        if test_cat is None:
+            if tstring:
+                start, end = str2timewindow(tstring)
+            else:
+                start = self.start_date
+                end = self.end_date
+            test_cat = self._filter_window(catalog, start, end)
+            self._test_cats[tstring] = test_cat
 
-        sub_cat = self.catalog.filter(
-            [
-                f"origin_time < {end.timestamp() * 1000}",
-                f"origin_time >= {start.timestamp() * 1000}",
+        return copy.copy(test_cat)
+
+    def _filter_window(
+        self, catalog: CSEPCatalog, start: datetime.datetime, end: datetime.datetime
+    ) -> CSEPCatalog:
+        """
+        Filters a catalog to the events within a time window and the experiment magnitude
+        range (and region, if any). The time/magnitude bounds and the (cached) region mask
+        are evaluated as a single vectorized mask over the catalog records, instead of one
+        copy per filter statement.
+
+        Args:
+            catalog (CSEPCatalog): The catalog to be filtered
+            start (datetime.datetime): Start of the time window (inclusive)
+            end (datetime.datetime): End of the time window (exclusive)
+
+        Returns:
+            A new filtered CSEPCatalog instance
+        """
+        start_ms = start.timestamp() * 1000
+        end_ms = end.timestamp() * 1000
+        origin_time = catalog.get_epoch_times()
+        magnitude = catalog.get_magnitudes()
+        mask = (
+            (origin_time < end_ms)
+            & (origin_time >= start_ms)
+            & (magnitude >= self.mag_min)
+            & (magnitude < self.mag_max)
+        )
+        region = catalog.region
+        if self.region:
+            mask &= self._spatial_mask(catalog)
+            region = self.region
+
+        return catalog.__class__(
+            data=catalog.catalog[mask],
+            catalog_id=catalog.catalog_id,
+            format=catalog.format,
+            name=catalog.name,
+            region=region,
+            filters=[
+                f"origin_time < {end_ms}",
+                f"origin_time >= {start_ms}",
                 f"magnitude >= {self.mag_min}",
                 f"magnitude < {self.mag_max}",
             ],
-            in_place=False,
         )
-        if self.region:
-            sub_cat.filter_spatial(region=self.region, in_place=True)
-
-        return sub_cat
 
     def set_test_cat(self, tstring: str) -> None:
         """
@@ -477,18 +679,8 @@ class CatalogRepository:
                 f"Filtering testing catalog and saving to {self.registry.rel(testcat_name)}"
             )
             start, end = str2timewindow(tstring)
-            sub_cat = self.catalog.filter(
-                [
-                    f"origin_time < {end.timestamp() * 1000}",
-                    f"origin_time >= {start.timestamp() * 1000}",
-                    f"magnitude >= {self.mag_min}",
-                    f"magnitude < {self.mag_max}",
-                ],
-                in_place=False,
-            )
-            if self.region:
-                sub_cat.filter_spatial(region=self.region, in_place=True)
-            sub_cat.write_json(filename=testcat_name)
+            sub_cat = self._filter_window(self.catalog, start, end)
+            _write_catalog_json(sub_cat, testcat_name)
         else:
             log.debug(f"Using test catalog from {self.registry.rel(testcat_name)}")
 
@@ -503,5 +695,7 @@ class CatalogRepository:
              catalog
         """
         start, end = str2timewindow(tstring)
-        sub_cat = self.catalog.filter([f"origin_time < {start.timestamp() * 1000}"])
+        sub_cat = self.catalog.filter(
+            [f"origin_time < {start.timestamp() * 1000}"], in_place=False
+        )
         sub_cat.write_ascii(filename=model.registry.get("input_cat"))
@@ -122,17 +122,17 @@ class Model(ABC):
                 f"structure"
             )
 
-    def as_dict(self, excluded=("name", "repository", "workdir")):
+    def as_dict(self, excluded=("name", "repository", "workdir", "environment")):
         """
         Returns:
             Dictionary with relevant attributes. Model can be re-instantiated from this dict
         """
 
-        list_walk = [
-            (i, j) for i, j in sorted(self.__dict__.items()) if not i.startswith("_") and j
-        ]
-
-        dict_walk = {i: j for i, j in list_walk if i not in excluded}
+        dict_walk = {
+            i: j
+            for i, j in sorted(self.__dict__.items())
+            if i[:1] != "_" and i not in excluded and j
+        }
         dict_walk["path"] = dict_walk.pop("registry").path
 
         return {self.name: parse_nested_dicts(dict_walk)}
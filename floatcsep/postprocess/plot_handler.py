@@ -1,7 +1,8 @@
+import functools
 import importlib.util
 import logging
 import os
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Union, Dict
 
 from cartopy import crs as ccrs
 from matplotlib import pyplot
@@ -16,6 +17,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("floatLogger")
 
+# Custom plotting scripts already executed, keyed by (path, modification time, size)
+_SCRIPT_CACHE: Dict[tuple, object] = {}
+
 
 def plot_results(experiment: "Experiment") -> None:
     """
@@ -27,7 +31,7 @@ def plot_results(experiment: "Experiment") -> None:
 
     """
     log.info("Plotting evaluation results")
-    timewindows = timewindow2str(experiment.timewindows)
+    timewindows = experiment._tw_strs
 
     for test in experiment.tests:
         test.plot_results(timewindows, experiment.models, experiment.registry)
@@ -76,9 +80,9 @@ def plot_forecasts(experiment: "Experiment") -> None:
 
     # Get the time windows to be plotted. Defaults to only the last time window.
     time_windows = (
-        timewindow2str(experiment.timewindows)
+        experiment._tw_strs
         if plot_forecast_config.get("all_time_windows")
-        else [timewindow2str(experiment.timewindows[-1])]
+        else experiment._tw_strs[-1:]
     )
 
     # Get the projection of the plots
@@ -86,29 +90,47 @@ def plot_forecasts(experiment: "Experiment") -> None:
         plot_forecast_config.get("projection")
     )
 
+    # If catalog option is passed, catalog is plotted on top of the forecast. The test
+    # catalogs do not depend on the model, so they are filtered once per time window.
+    cat_args = plot_forecast_config.get("catalog")
+    test_catalogs = {}
+    if cat_args:
+        if cat_args is True:
+            cat_args = {}
+        cat_args = {**cat_args, "basemap": plot_forecast_config.get("basemap", None)}
+        test_catalogs = {
+            window: experiment.catalog_repo.get_test_cat(window) for window in time_windows
+        }
+    dpi = plot_forecast_config.get("dpi", 300)
+
     for model in experiment.models:
         for window in time_windows:
-            ax = model.get_forecast(window, experiment.region).plot(
-                plot_args=plot_forecast_config
+            _plot_forecast(
+                model.get_forecast(window, experiment.region),
+                plot_forecast_config,
+                test_catalogs.get(window),
+                cat_args,
+                experiment.registry.get_figure(window, "forecasts", model.name),
+                dpi,
             )
 
-            # If catalog option is passed, catalog is plotted on top of the forecast
-            if plot_forecast_config.get("catalog"):
-                cat_args = plot_forecast_config.get("catalog", {})
-                if cat_args is True:
-                    cat_args = {}
-                experiment.catalog_repo.get_test_cat(window).plot(
-                    ax=ax,
-                    extent=ax.get_extent(),
-                    plot_args=cat_args.update(
-                        {
-                            "basemap": plot_forecast_config.get("basemap", None),
-                            "title": ax.get_title(),
-                        }
-                    ),
-                )
-            fig_path = experiment.registry.get_figure(window, "forecasts", model.name)
-            pyplot.savefig(fig_path, dpi=plot_forecast_config.get("dpi", 300))
+
+def _plot_forecast(
+    forecast, plot_config: dict, test_catalog, cat_args, fig_path: str, dpi: int
+) -> None:
+    """
+    Plots a single forecast, optionally with its test catalog on top, and saves the figure.
+    """
+    ax = forecast.plot(plot_args=plot_config)
+
+    if test_catalog is not None:
+        test_catalog.plot(
+            ax=ax,
+            extent=ax.get_extent(),
+            plot_args={**cat_args, "title": ax.get_title()},
+        )
+    pyplot.savefig(fig_path, dpi=dpi)
+    pyplot.close()
 
 
 def plot_catalogs(experiment: "Experiment") -> None:
@@ -166,32 +188,43 @@ def plot_catalogs(experiment: "Experiment") -> None:
         log.debug(f"Catalog has zero events in {experiment_timewindow}")
         return
 
+    dpi = plot_catalog_config.get("dpi", 300)
+
     # Plot catalog map
     ax = main_catalog.plot(plot_args=plot_catalog_config)
     cat_map_path = experiment.registry.get_figure("main_catalog_map")
-    ax.get_figure().savefig(cat_map_path, dpi=plot_catalog_config.get("dpi", 300))
+    _save_figure(ax.get_figure(), cat_map_path, dpi)
 
     # Plot catalog time series vs. magnitude
     ax = magnitude_vs_time(main_catalog)
     cat_time_path = experiment.registry.get_figure("main_catalog_time")
-    ax.get_figure().savefig(cat_time_path, dpi=plot_catalog_config.get("dpi", 300))
+    _save_figure(ax.get_figure(), cat_time_path, dpi)
 
     # If selected, plot the test catalogs for each of the time windows
     if plot_catalog_config.get("all_time_windows"):
-        for tw in experiment.timewindows:
-            test_catalog = experiment.catalog_repo.get_test_cat(timewindow2str(tw))
+        for tw in experiment._tw_strs:
+            test_catalog = experiment.catalog_repo.get_test_cat(tw)
 
-            if test_catalog.get_number_of_events() != 0:
+            if test_catalog.get_number_of_events() == 0:
                 log.debug(f"Catalog has zero events in {tw}. Skip plotting")
                 continue
 
             ax = test_catalog.plot(plot_args=plot_catalog_config)
             cat_map_path = experiment.registry.get_figure(tw, "catalog_map")
-            ax.get_figure().savefig(cat_map_path, dpi=plot_catalog_config.get("dpi", 300))
+            _save_figure(ax.get_figure(), cat_map_path, dpi)
 
             ax = magnitude_vs_time(test_catalog)
             cat_time_path = experiment.registry.get_figure(tw, "catalog_time")
-            ax.get_figure().savefig(cat_time_path, dpi=plot_catalog_config.get("dpi", 300))
+            _save_figure(ax.get_figure(), cat_time_path, dpi)
+
+
+def _save_figure(fig: pyplot.Figure, fig_path: str, dpi: int) -> None:
+    """
+    Saves a figure to the given path and releases it from pyplot, so figures do not
+    accumulate in memory when plotting many catalogs.
+    """
+    fig.savefig(fig_path, dpi=dpi)
+    pyplot.close(fig)
 
 
 def plot_custom(experiment: "Experiment"):
@@ -214,11 +247,14 @@ def plot_custom(experiment: "Experiment"):
     script_path, func_name = plot_config
 
     log.info(f"Plotting from script {script_path} and function {func_name}")
-    script_abs_path = experiment.registry.abs(script_path)
-    allowed_directory = os.path.dirname(experiment.registry.abs(experiment.config_file))
+    # Resolve both paths once; the directory check precedes the (stat) file check.
+    script_abs_path = os.path.realpath(experiment.registry.abs(script_path))
+    allowed_directory = os.path.realpath(
+        os.path.dirname(experiment.registry.abs(experiment.config_file))
+    )
 
-    if not os.path.isfile(script_path) or (
-        os.path.dirname(script_abs_path) != os.path.realpath(allowed_directory)
+    if os.path.dirname(script_abs_path) != allowed_directory or not os.path.isfile(
+        script_abs_path
     ):
 
         log.error(f"Script {script_path} is not in the configuration file directory.")
@@ -228,10 +264,7 @@ def plot_custom(experiment: "Experiment"):
         )
         return
 
-    module_name = os.path.splitext(os.path.basename(script_abs_path))[0]
-    spec = importlib.util.spec_from_file_location(module_name, script_abs_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    module = _load_script(script_abs_path)
     # Execute the script securely
     try:
         func = getattr(module, func_name)
@@ -255,6 +288,26 @@ def plot_custom(experiment: "Experiment"):
     return
 
 
+def _load_script(script_abs_path: str) -> object:
+    """
+    Imports a custom plotting script as a module. The module is re-executed only if the script
+    was modified since it was last loaded.
+
+    Args:
+        script_abs_path (str): Absolute path of the python script
+    """
+    st = os.stat(script_abs_path)
+    key = (script_abs_path, st.st_mtime_ns, st.st_size)
+    module = _SCRIPT_CACHE.get(key)
+    if module is None:
+        module_name = os.path.splitext(os.path.basename(script_abs_path))[0]
+        spec = importlib.util.spec_from_file_location(module_name, script_abs_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _SCRIPT_CACHE[key] = module
+    return module
+
+
 def parse_plot_config(plot_config: Union[dict, str, bool]):
     """
     Parses the configuration of a given plot directive, usually gotten from the experiment
@@ -315,7 +368,7 @@ def parse_projection(proj_config: Union[dict, str, bool]):
 
     """
     if proj_config is None:
-        return ccrs.PlateCarree(central_longitude=0.0)
+        return _get_projection("PlateCarree", (("central_longitude", 0.0),))
 
     if isinstance(proj_config, dict):
         proj_name, proj_args = next(iter(proj_config.items()))
@@ -323,6 +376,19 @@ def parse_projection(proj_config: Union[dict, str, bool]):
         proj_name, proj_args = proj_config, {}
 
     if not isinstance(proj_name, str):
-        return ccrs.PlateCarree(central_longitude=0.0)
+        return _get_projection("PlateCarree", (("central_longitude", 0.0),))
+
+    try:
+        return _get_projection(proj_name, tuple(sorted((proj_args or {}).items())))
+    except TypeError:
+        # Unhashable projection arguments
+        return getattr(ccrs, proj_name, ccrs.PlateCarree)(**proj_args)
 
-    return getattr(ccrs, proj_name, ccrs.PlateCarree)(**proj_args)
+
+@functools.lru_cache(maxsize=8)
+def _get_projection(proj_name: str, proj_args: tuple) -> ccrs.Projection:
+    """
+    Creates a cartopy projection from its name and its sorted keyword arguments. Cached, since
+    the same projection is parsed for every plotting directive.
+    """
+    return getattr(ccrs, proj_name, ccrs.PlateCarree)(**dict(proj_args))
@@ -74,6 +74,7 @@ def generate_report(experiment, timewindow=-1):
     report.add_list(test_names)
 
     # Include results from Experiment
+    window_figures = experiment.registry.figures[timestr]
     for test in experiment.tests:
         fig_path = experiment.registry.get_figure(timestr, test)
         width = test.plot_args[0].get("figsize", [4])[0] * 96
@@ -81,19 +82,18 @@ def generate_report(experiment, timewindow=-1):
             f"{test.name}", fig_path, level=3, caption=test.markdown, add_ext=True, width=width
         )
         for model in experiment.models:
-            try:
-                fig_path = experiment.registry.get_figure(timestr, f"{test.name}_{model.name}")
-                width = test.plot_args[0].get("figsize", [4])[0] * 96
-                report.add_figure(
-                    f"{test.name}: {model.name}",
-                    fig_path,
-                    level=3,
-                    caption=test.markdown,
-                    add_ext=True,
-                    width=width,
-                )
-            except KeyError:
-                pass
+            # Single model figures only exist for some tests
+            fig_name = f"{test.name}_{model.name}"
+            if fig_name not in window_figures:
+                continue
+            report.add_figure(
+                f"{test.name}: {model.name}",
+                experiment.registry.get_figure(timestr, fig_name),
+                level=3,
+                caption=test.markdown,
+                add_ext=True,
+                width=width,
+            )
     report.table_of_contents()
     report.save(experiment.registry.abs(experiment.registry.run_dir))
 
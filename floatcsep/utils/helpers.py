@@ -10,11 +10,17 @@ from typing import Union, Mapping, Sequence
 # third-party libraries
 import numpy
 import pandas
+from pandas.tseries.frequencies import to_offset
 import scipy.stats
 import seaborn
-import yaml
 from matplotlib import pyplot
 from matplotlib.lines import Line2D
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
 # pyCSEP libraries
 import csep.core
@@ -142,9 +148,8 @@ def read_time_cfg(time_config, **kwargs):
         windows to be evaluated
     """
     _attrs = ["start_date", "end_date", "intervals", "horizon", "offset", "growth", "exp_class"]
-    time_config = copy.deepcopy(time_config)
-    if time_config is None:
-        time_config = {}
+    # only top-level keys are (re-)assigned, so a shallow copy keeps the input unchanged
+    time_config = dict(time_config) if time_config is not None else {}
 
     try:
         experiment_class = time_config.get("exp_class", kwargs["exp_class"])
@@ -184,10 +189,9 @@ def read_region_cfg(region_config, **kwargs):
     Returns:
         A dictionary containing the region attributes of the experiment
     """
-    region_config = copy.deepcopy(region_config)
+    # only top-level keys are (re-)assigned, so a shallow copy keeps the input unchanged
+    region_config = dict(region_config) if region_config is not None else {}
     _attrs = ["region", "mag_min", "mag_max", "mag_bin", "magnitudes", "depth_min", "depth_max"]
-    if region_config is None:
-        region_config = {}
     region_config.update({i: j for i, j in kwargs.items() if i in _attrs})
 
     dmin = region_config.get("depth_min", -2)
@@ -201,41 +205,87 @@ def read_region_cfg(region_config, **kwargs):
         magnitudes = cleaner_range(magmin, magmax, magbin)
 
     region_data = region_config.get("region", None)
-    try:
-        region = (
-            parse_csep_func(region_data)(name=region_data, magnitudes=magnitudes)
-            if region_data
-            else None
-        )
-    except AttributeError:
-        if isinstance(region_data, str):
-            filename = os.path.join(kwargs.get("path", ""), region_data)
-            with open(filename, "r") as file_:
-                parsed_region = file_.readlines()
-                try:
-                    data = numpy.array(
-                        [re.split(r"\s+|,", i.strip()) for i in parsed_region], dtype=float
-                    )
-                except ValueError:
-                    data = numpy.array(
-                        [re.split(r"\s+|,", i.strip()) for i in parsed_region[1:]], dtype=float
-                    )
-                dh1 = scipy.stats.mode(numpy.diff(numpy.unique(data[:, 0]))).mode
-                dh2 = scipy.stats.mode(numpy.diff(numpy.unique(data[:, 1]))).mode
-                dh = numpy.nanmin([dh1, dh2])
-                region = CartesianGrid2D.from_origins(
-                    data, name=region_data, magnitudes=magnitudes, dh=dh
-                )
-                region_config.update({"path": region_data})
-        else:
-            region_data["magnitudes"] = magnitudes
-            region = CartesianGrid2D.from_dict(region_data)
+    if isinstance(region_data, str):
+        region, from_file = _read_region_cached(region_data, magnitudes, kwargs.get("path", ""))
+        if from_file:
+            region_config.update({"path": region_data})
+    elif region_data:
+        try:
+            region = parse_csep_func(region_data)(name=region_data, magnitudes=magnitudes)
+        except AttributeError:
+            region = CartesianGrid2D.from_dict({**region_data, "magnitudes": magnitudes})
+    else:
+        region = None
 
     region_config.update({"depths": depths, "magnitudes": magnitudes, "region": region})
 
     return region_config
 
 
+# Number of built regions kept in memory, since those of global grids are large
+_REGION_CACHE_SIZE = 8
+
+
+def _read_region(region_data: str, magnitudes: Sequence, path: str = "") -> tuple:
+    """
+    Builds a region from the name of a :mod:`csep`/:mod:`floatcsep` region function or a user
+    function, or otherwise from the path of a lat/lon file.
+
+    Returns:
+        The :class:`~csep.core.regions.CartesianGrid2D` and whether it was read from a file.
+    """
+    try:
+        return parse_csep_func(region_data)(name=region_data, magnitudes=magnitudes), False
+    except AttributeError:
+        filename = os.path.join(path, region_data)
+        with open(filename, "r") as file_:
+            # coordinates can be separated by whitespaces and/or commas
+            parsed_region = file_.read().replace(",", " ").splitlines()
+            try:
+                data = numpy.loadtxt(parsed_region, dtype=float, ndmin=2)
+            except ValueError:
+                # header line
+                data = numpy.loadtxt(parsed_region[1:], dtype=float, ndmin=2)
+            dh1 = scipy.stats.mode(numpy.diff(numpy.unique(data[:, 0]))).mode
+            dh2 = scipy.stats.mode(numpy.diff(numpy.unique(data[:, 1]))).mode
+            dh = numpy.nanmin([dh1, dh2])
+            region = CartesianGrid2D.from_origins(
+                data, name=region_data, magnitudes=magnitudes, dh=dh
+            )
+        return region, True
+
+
+@functools.lru_cache(maxsize=_REGION_CACHE_SIZE)
+def _load_region(region_data: str, path: str, file_key: tuple, magnitudes: tuple) -> tuple:
+    """
+    Cached :func:`_read_region`, keyed on the file modification time and size (``file_key``)
+    and on the magnitude bins as a tuple.
+    """
+    return _read_region(region_data, numpy.array(magnitudes), path)
+
+
+def _read_region_cached(region_data: str, magnitudes: Sequence, path: str = "") -> tuple:
+    """
+    Builds a region as :func:`_read_region`, re-using a previous build with the same region
+    name, magnitudes and, if the region is a file, the same modification time and size.
+    Building a region (e.g., its bitmask) is the most expensive step of setting up an
+    experiment, and is repeated whenever an experiment is created from the same config.
+
+    Returns:
+        A shallow copy of the region, so its attributes can be re-assigned by the caller, and
+        whether it was read from a file.
+    """
+    try:
+        st = os.stat(os.path.join(path, region_data))
+        file_key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        file_key = None
+    region, from_file = _load_region(
+        region_data, path, file_key, tuple(numpy.asarray(magnitudes).tolist())
+    )
+    return copy.copy(region), from_file
+
+
 def timewindow2str(datetimes: Sequence) -> Union[str, list[str]]:
     """
     Converts a time window (list/tuple of datetimes) to a string that represents it.  Can be a
@@ -318,7 +368,6 @@ def timewindows_ti(
         timelimits = pandas.date_range(
             start=start_date, end=end_date, periods=periods, freq=frequency
         )
-        print(timelimits)
         timelimits = timelimits.to_pydatetime()
     except ValueError as e_:
         raise ValueError(
@@ -337,6 +386,48 @@ def timewindows_ti(
         return [(timelimits[0], i) for i in timelimits[1:]]
 
 
+def _offset_windows(start_date, frequency, offset, intervals=None, end_date=None):
+    """
+    Creates time windows of length ``frequency``, whose starts are separated by ``offset``
+    (i.e., overlapping windows if the offset is shorter than the frequency). The windows are
+    either a number of ``intervals``, or as many as needed until one reaches ``end_date``.
+
+    All windows are computed at once with vectorized offset arithmetic. Each boundary equals
+    the second element of a ``pandas.date_range`` starting from the previous window start,
+    i.e., anchored frequencies (e.g. month/year starts) are rolled forward first.
+
+    Returns:
+        List of tuples containing the lower and upper boundaries of each window, as
+        :py:class:`datetime.datetime`.
+    """
+    # no window fits in an empty time span (windows are only added while the previous one
+    # ends before end_date)
+    if (intervals is not None and intervals <= 0) or (
+        end_date is not None and end_date <= start_date
+    ):
+        return []
+
+    horizon = to_offset(frequency)
+    if intervals is None:
+        # window starts (up to the end date), plus the one after them. Anchored offsets can
+        # roll the first start past the end date (n_starts == 0), but the window beginning
+        # at start_date itself is still created
+        n_starts = len(pandas.date_range(start=start_date, end=end_date, freq=offset))
+        intervals = max(n_starts, 1) + 1
+
+    starts = pandas.date_range(start=start_date, periods=intervals, freq=offset)
+    starts = pandas.DatetimeIndex([start_date]).append(starts[1:])
+    # adding a zero-length offset rolls the starts forward onto the anchored frequency
+    ends = (starts + horizon * 0) + horizon
+
+    if end_date is not None:
+        # windows are added until (and including) the first one reaching the end date
+        n_windows = ends.searchsorted(end_date, side="left") + 1
+        starts, ends = starts[:n_windows], ends[:n_windows]
+
+    return list(zip(starts.to_pydatetime(), ends.to_pydatetime()))
+
+
 def timewindows_td(
     start_date=None, end_date=None, timeintervals=None, timehorizon=None, timeoffset=None, **_
 ):
@@ -380,34 +471,10 @@ def timewindows_td(
     windows = []
 
     if start_date and end_date and timehorizon and timeoffset:
-
-        current_start = start_date
-        current_end = start_date
-        while current_end < end_date:
-            next_window = pandas.date_range(
-                start=current_start, periods=2, freq=frequency
-            ).tolist()
-
-            current_end = next_window[1]
-
-            windows.append((current_start, current_end))
-
-            current_start = pandas.date_range(start=current_start, periods=2, freq=offset)[
-                1
-            ].to_pydatetime()
+        windows = _offset_windows(start_date, frequency, offset, end_date=end_date)
 
     elif start_date and timeintervals and timehorizon and timeoffset:
-
-        for _ in range(timeintervals):
-            next_window = pandas.date_range(
-                start=start_date, periods=2, freq=frequency
-            ).tolist()
-            lower_bound = start_date
-            upper_bound = next_window[1]
-            windows.append((lower_bound, upper_bound))
-            start_date = pandas.date_range(start=start_date, periods=2, freq=offset)[
-                1
-            ].to_pydatetime()
+        windows = _offset_windows(start_date, frequency, offset, intervals=timeintervals)
 
     elif start_date and end_date and timeintervals:
         if timeintervals == 1:
@@ -444,47 +511,109 @@ def timewindows_td(
     return windows
 
 
+# Types that are returned unchanged when parsing nested dictionaries
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def parse_nested_dicts(nested_dict: dict) -> dict:
     """
     Parses nested dictionaries to return appropriate parsing on each element
     """
 
     def _get_value(x):
-        # For each element type, transforms to desired string/output
-        if hasattr(x, "as_dict"):
+        # For each element type, transforms to desired string/output. Attributes are looked up
+        # with defaults, so that plain values do not raise (and discard) AttributeErrors.
+        as_dict = getattr(x, "as_dict", None)
+        if as_dict is not None:
             # e.g. model, test, etc.
-            o = x.as_dict()
-        else:
-            try:
-                try:
-                    o = getattr(x, "__name__")
-                except AttributeError:
-                    o = getattr(x, "name")
-            except AttributeError:
-                if isinstance(x, numpy.ndarray):
-                    o = x.tolist()
-                else:
-                    o = x
-        return o
+            return as_dict()
+        name = getattr(x, "__name__", None)
+        if name is None:
+            name = getattr(x, "name", None)
+        if name is not None:
+            return name
+        if isinstance(x, numpy.ndarray):
+            return x.tolist()
+        return x
+
+    # Parsed containers by id, so those shared across keys are walked only once
+    memo = {}
 
     def iter_attr(val):
-        # recursive iter through nested dicts/lists
-        if isinstance(val, Mapping):
-            return {item: iter_attr(val_) for item, val_ in val.items()}
-        elif isinstance(val, Sequence) and not isinstance(val, str):
-            return [iter_attr(i) for i in val]
-        else:
-            return _get_value(val)
+        # Iterates through nested dicts/lists with an explicit stack of (parent, key, value)
+        # slots, instead of recursing once per element. Containers are created empty and
+        # filled in place as their items are popped. The exact built-in types are checked
+        # first, since isinstance against the abstract classes is comparatively slow.
+        root = [None]
+        stack = [(root, 0, val)]
+        while stack:
+            parent, key, val = stack.pop()
+            val_type = type(val)
+            if val_type in _SCALAR_TYPES:
+                parent[key] = val
+                continue
+            if val_type is numpy.ndarray:
+                parent[key] = val.tolist()
+                continue
+            val_id = id(val)
+            if val_id in memo:
+                parent[key] = memo[val_id]
+                continue
+            if val_type is dict or isinstance(val, Mapping):
+                out = dict.fromkeys(val)
+                stack.extend((out, item, val_) for item, val_ in val.items())
+            elif val_type is list or val_type is tuple or (
+                isinstance(val, Sequence) and not isinstance(val, str)
+            ):
+                out = [None] * len(val)
+                stack.extend((out, i, val_) for i, val_ in enumerate(val))
+            else:
+                parent[key] = _get_value(val)
+                continue
+            memo[val_id] = out
+            parent[key] = out
+        return root[0]
 
     return iter_attr(nested_dict)
 
 
-class NoAliasLoader(yaml.Loader):
+class NoAliasLoader(_YamlLoader):
+    """YAML loader based on the libyaml bindings if available; falls back to pure-Python."""
+
     @staticmethod
     def ignore_aliases(self):
         return True
 
 
+def _construct_legacy_python(loader: NoAliasLoader, suffix: str, node: yaml.Node) -> object:
+    # Configuration files written by former versions (e.g., repr_config.yml) were dumped with
+    # the full python representers. Tuples are read back, whereas arbitrary python objects
+    # (e.g., a model's environment manager) are dropped, since they are re-created on load.
+    if suffix == "tuple":
+        return tuple(loader.construct_sequence(node, deep=True))
+    log.debug(f"Ignoring python object with tag {node.tag} in .yml file")
+    return None
+
+
+NoAliasLoader.add_multi_constructor("tag:yaml.org,2002:python/", _construct_legacy_python)
+
+
+class NoAliasDumper(_YamlDumper):
+    """YAML dumper based on the libyaml bindings if available; falls back to pure-Python."""
+
+    def ignore_aliases(self, data):
+        return True
+
+
+def _represent_numpy_scalar(dumper: NoAliasDumper, data: numpy.generic) -> yaml.Node:
+    # numpy scalars (e.g., magnitude/depth bounds computed with numpy) are written as their
+    # python equivalents, since the safe representers only match the exact built-in types
+    return dumper.represent_data(data.item())
+
+
+NoAliasDumper.add_multi_representer(numpy.generic, _represent_numpy_scalar)
+
+
 #######################
 # Perhaps add to pycsep
 #######################
@@ -22,8 +22,8 @@ class DataTest(unittest.TestCase):
         )
 
     @staticmethod
-    def run_evaluation(cfg_file):
-        main.run(cfg_file, show=False)
+    def run_evaluation(cfg_file, **kwargs):
+        main.run(cfg_file, show=False, **kwargs)
 
     @staticmethod
     def repr_evaluation(cfg_file):
@@ -74,6 +74,11 @@ class RunExamples(DataTest):
         self.run_evaluation(cfg)
         self.assertEqual(1, 1)
 
+    def test_case_g_concurrent(self, *args):
+        cfg = self.get_runpath("g")
+        self.run_evaluation(cfg, max_workers=4)
+        self.assertEqual(1, 1)
+
 
 @patch("floatcsep.commands.main.plot_forecasts")
 @patch("floatcsep.commands.main.plot_catalogs")
@@ -104,6 +104,37 @@ class TestMainModule(unittest.TestCase):
         mock_comp_instance.compare_results.assert_called_once()
         mock_reproducibility_report.assert_called_once_with(exp_comparison=mock_comp_instance)
 
+    @patch('floatcsep.commands.main.set_console_log_level')
+    @patch('floatcsep.commands.main.stage')
+    def test_floatcsep(self, mock_stage, mock_set_console_log_level):
+        with patch('sys.argv', ['floatcsep', 'stage', 'dummy_config', '-d']):
+            main_module.floatcsep()
+
+        mock_set_console_log_level.assert_called_once_with('DEBUG')
+        mock_stage.assert_called_once_with(
+            config='dummy_config', logging=False, timestamp=False, debug=True
+        )
+
+    @patch('floatcsep.commands.main.run')
+    def test_floatcsep_max_workers(self, mock_run):
+        with patch('sys.argv', ['floatcsep', 'run', 'dummy_config', '-j', '4']):
+            main_module.floatcsep()
+
+        mock_run.assert_called_once_with(
+            config='dummy_config', logging=False, timestamp=False, max_workers=4
+        )
+
+    @patch('floatcsep.commands.main.set_console_log_level')
+    @patch('floatcsep.commands.main.run')
+    def test_floatcsep_flags_before_command(self, mock_run, mock_set_console_log_level):
+        with patch('sys.argv', ['floatcsep', '-d', '-t', 'run', 'dummy_config']):
+            main_module.floatcsep()
+
+        mock_set_console_log_level.assert_called_once_with('DEBUG')
+        mock_run.assert_called_once_with(
+            config='dummy_config', logging=False, timestamp=True, debug=True
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -22,6 +22,10 @@ class TestTask(unittest.TestCase):
         self.assertEqual(self.task.method, "dummy_method")
         self.assertEqual(self.task.kwargs["value"], 10)
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self.task, "__dict__"))
+        self.assertIsNone(self.task.store)
+
     def test_sign_match(self):
         self.assertTrue(self.task.sign_match(obj=self.obj, meth="dummy_method", kw_arg=10))
         self.assertFalse(
@@ -79,6 +83,28 @@ class TestTaskGraph(unittest.TestCase):
         self.graph()
         self.assertEqual(self.task_a.store, 20)
 
+    def test_run_concurrent(self):
+        calls = []
+
+        class Recorder(DummyClass):
+            def dummy_method(self, value):
+                calls.append(value)
+                return value * 2
+
+        obj = Recorder("Recorder")
+        tasks = [Task(instance=obj, method="dummy_method", value=i) for i in range(1, 5)]
+        for task in tasks:
+            self.graph.add(task)
+        # Chain the tasks in reverse order of addition
+        for i in range(3):
+            self.graph.add_dependency(
+                tasks[i], dep_inst=obj, dep_meth="dummy_method", dkw=i + 2
+            )
+
+        self.graph.run(max_workers=4)
+        self.assertEqual(calls, [4, 3, 2, 1])
+        self.assertEqual([task.store for task in tasks], [2, 4, 6, 8])
+
 
 if __name__ == "__main__":
     unittest.main()
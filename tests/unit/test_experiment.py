@@ -1,14 +1,25 @@
+import json
 import os.path
 import tempfile
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 import numpy
+import yaml
 from unittest import TestCase
 from datetime import datetime
-from floatcsep.experiment import Experiment
+
+from floatcsep.experiment import (
+    Experiment,
+    ExperimentComparison,
+    _json_default,
+    _load_yaml_cached,
+    _read_yml_sidecar,
+)
+from floatcsep.utils.helpers import NoAliasLoader
 from csep.core import poisson_evaluations
 
 _dir = os.path.dirname(__file__)
+_cwd = os.getcwd()
 _model_cfg = os.path.normpath(os.path.join(_dir, "../artifacts", "models", "model_cfg.yml"))
 _region = os.path.normpath(os.path.join(_dir, "../artifacts", "regions", "mock_region"))
 _time_config = {"start_date": datetime(2021, 1, 1), "end_date": datetime(2022, 1, 1)}
@@ -37,15 +48,17 @@ class TestExperiment(TestCase):
         self.makedirs_patch.stop()
 
     def assertEqualExperiment(self, exp_a, exp_b):
+        self.assertEqual(exp_a.registry.workdir, _cwd)
+        if exp_a is exp_b:
+            return
         self.assertEqual(exp_a.name, exp_b.name)
-        self.assertEqual(exp_a.registry.workdir, os.getcwd())
         self.assertEqual(exp_a.registry.workdir, exp_b.registry.workdir)
         self.assertEqual(exp_a.start_date, exp_b.start_date)
         self.assertEqual(exp_a.timewindows, exp_b.timewindows)
         self.assertEqual(exp_a.exp_class, exp_b.exp_class)
         self.assertEqual(exp_a.region, exp_b.region)
-        numpy.testing.assert_equal(exp_a.magnitudes, exp_b.magnitudes)
-        numpy.testing.assert_equal(exp_a.depths, exp_b.depths)
+        self.assertTrue(numpy.array_equal(exp_a.magnitudes, exp_b.magnitudes))
+        self.assertTrue(numpy.array_equal(exp_a.depths, exp_b.depths))
         self.assertEqual(exp_a.catalog, exp_b.catalog)
 
     def test_init(self):
@@ -53,6 +66,20 @@ class TestExperiment(TestCase):
         exp_b = Experiment(time_config=_time_config, region_config=_region_config, catalog=_cat)
         self.assertEqualExperiment(exp_a, exp_b)
 
+    def test_getattr(self):
+        exp = Experiment(**_time_config, **_region_config, catalog=_cat)
+        self.assertEqual(exp.start_date, _time_config["start_date"])
+        self.assertEqual(exp.mag_bin, _region_config["mag_bin"])
+        self.assertIs(exp.depths, exp.region_config["depths"])
+        with self.assertRaises(AttributeError):
+            _ = exp.not_an_attribute
+
+        # in-place edits of the configurations are visible through the attributes
+        exp.region_config["mag_bin"] = 0.5
+        exp.time_config["end_date"] = datetime(2023, 1, 1)
+        self.assertEqual(exp.mag_bin, 0.5)
+        self.assertEqual(exp.end_date, datetime(2023, 1, 1))
+
     def test_to_dict(self):
         time_config = {
             "start_date": datetime(2020, 1, 1),
@@ -73,7 +100,7 @@ class TestExperiment(TestCase):
         exp_a = Experiment(name="test", **time_config, **region_config, catalog=_cat)
         dict_ = {
             "name": "test",
-            "path": os.getcwd(),
+            "path": _cwd,
             "run_dir": "results",
             "config_file": None,
             "models": [],
@@ -93,7 +120,7 @@ class TestExperiment(TestCase):
                 "depth_min": -2,
                 "depth_max": 70,
             },
-            "catalog": os.path.relpath(_cat, os.getcwd()),
+            "catalog": os.path.relpath(_cat, _cwd),
         }
         self.assertEqual(dict_, exp_a.as_dict())
 
@@ -114,16 +141,127 @@ class TestExperiment(TestCase):
         }
 
         exp_a = Experiment(**time_config, **region_config, catalog=_cat)
-        file_ = tempfile.mkstemp()[1]
-        exp_a.to_yml(file_)
-        exp_b = Experiment.from_yml(file_)
+        with tempfile.TemporaryDirectory() as dir_:
+            file_ = os.path.join(dir_, "a.yml")
+            exp_a.to_yml(file_)
+            exp_b = Experiment.from_yml(file_)
 
-        self.assertEqualExperiment(exp_a, exp_b)
+            self.assertEqualExperiment(exp_a, exp_b)
 
-        file_ = tempfile.mkstemp()[1]
-        exp_a.to_yml(file_)
-        exp_c = Experiment.from_yml(file_)
-        self.assertEqualExperiment(exp_a, exp_c)
+            file_ = os.path.join(dir_, "b.yml")
+            exp_a.to_yml(file_)
+            exp_c = Experiment.from_yml(file_)
+            self.assertEqualExperiment(exp_a, exp_c)
+
+    def test_dump_many(self):
+        time_config = {
+            "start_date": datetime(2021, 1, 1),
+            "end_date": datetime(2022, 1, 1),
+            "intervals": 12,
+        }
+        exp_a = Experiment(name="a", **time_config, **_region_config, catalog=_cat)
+        exp_b = Experiment(name="b", **_time_config, **_region_config, catalog=_cat)
+
+        with tempfile.TemporaryDirectory() as dir_:
+            file_ = os.path.join(dir_, "experiments.yml")
+            Experiment.dump_many(file_, [exp_a, exp_b])
+            exps = Experiment.load_many(file_)
+
+        self.assertEqual(len(exps), 2)
+        self.assertEqualExperiment(exp_a, exps[0])
+        self.assertEqualExperiment(exp_b, exps[1])
+
+    def test_from_yml_sidecar(self):
+        time_config = {
+            "start_date": datetime(2021, 1, 1),
+            "end_date": datetime(2022, 1, 1),
+            "intervals": 12,
+        }
+        exp_a = Experiment(**time_config, **_region_config, catalog=_cat)
+
+        with tempfile.TemporaryDirectory() as dir_:
+            file_ = os.path.join(dir_, "config.yml")
+            exp_a.to_yml(file_)
+            self.assertTrue(os.path.isfile(f"{file_}.json"))
+
+            with patch("floatcsep.experiment.yaml.load") as mock_load:
+                exp_b = Experiment.from_yml(file_)
+                mock_load.assert_not_called()
+            self.assertEqualExperiment(exp_a, exp_b)
+
+            # the copy is ignored once the .yml file is touched
+            stat = os.stat(file_)
+            os.utime(file_, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            self.assertIsNone(_read_yml_sidecar(file_))
+
+            # or modified, even if its mtime is kept
+            os.utime(file_, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertIsNotNone(_read_yml_sidecar(file_))
+            with open(file_, "a") as f_:
+                f_.write("name: edited\n")
+            os.utime(file_, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(Experiment.from_yml(file_).name, "edited")
+
+    def test_to_yml_sidecar_skipped(self):
+        time_config = {
+            "start_date": datetime(2021, 1, 1),
+            "end_date": datetime(2022, 1, 1),
+            "intervals": 12,
+        }
+        exp = Experiment(**time_config, **_region_config, catalog=_cat)
+
+        with tempfile.TemporaryDirectory() as dir_:
+            file_ = os.path.join(dir_, "config.yml")
+
+            # objects that JSON would not read back as-is
+            for extra in ({"created": datetime(2021, 1, 1)}, {"ids": {1: "a"}}):
+                exp.to_yml(file_, extra=extra)
+                self.assertFalse(os.path.isfile(f"{file_}.json"))
+                key = next(iter(extra))
+                self.assertEqualExperiment(exp, Experiment.from_yml(file_))
+                with open(file_, "r") as f_:
+                    self.assertEqual(yaml.load(f_, NoAliasLoader)[key], extra[key])
+
+            # a failed encoding does not raise, nor leaves a stale copy
+            exp.to_yml(file_)
+            self.assertTrue(os.path.isfile(f"{file_}.json"))
+            with patch("floatcsep.experiment._write_json", side_effect=TypeError):
+                exp.to_yml(file_)
+            self.assertTrue(os.path.isfile(file_))
+            self.assertFalse(os.path.isfile(f"{file_}.json"))
+
+    def test_json_default(self):
+        self.assertEqual(_json_default(datetime(2021, 1, 1)), "2021-01-01T00:00:00")
+        self.assertEqual(_json_default(numpy.float64(0.5)), 0.5)
+        with self.assertRaises(TypeError):
+            _json_default(object())
+
+    def test_to_json(self):
+        time_config = {
+            "start_date": datetime(2021, 1, 1),
+            "end_date": datetime(2022, 1, 1),
+            "intervals": 12,
+        }
+
+        region_config = {
+            "region": "california_relm_region",
+            "mag_max": 9.0,
+            "mag_min": 3.0,
+            "mag_bin": 0.1,
+            "depth_min": -2,
+            "depth_max": 70,
+        }
+
+        exp_a = Experiment(**time_config, **region_config, catalog=_cat)
+        with tempfile.TemporaryDirectory() as dir_:
+            file_ = os.path.join(dir_, "a.json")
+            exp_a.to_json(file_)
+            with open(file_, "r") as f_:
+                dict_ = json.load(f_)
+
+        self.assertEqual(dict_["time_config"]["start_date"], "2021-01-01T00:00:00")
+        self.assertEqual(dict_["region_config"], exp_a.as_dict()["region_config"])
+        self.assertEqual(dict_["catalog"], exp_a.as_dict()["catalog"])
 
     def test_set_models(self):
         exp = Experiment(
@@ -131,10 +269,25 @@ class TestExperiment(TestCase):
         )
         names = [i.name for i in exp.models]
         self.assertEqual(["mock", "qtree@team10", "qtree@team25"], names)
+        self.assertIs(exp.get_model("qtree@team10"), exp.models[1])
+        self.assertIsNone(exp.get_model("qtree"))
         m1_path = os.path.normpath(
             os.path.join(_dir, "../artifacts", "models", "qtree", "TEAM=N10L11.csv")
         )
 
+    @patch("floatcsep.experiment.log")
+    def test_set_models_repeated(self, mock_log):
+        model_cfg = [{"mock": {"path": _cat}}, {"mock": {"path": _cat}}]
+        exp = Experiment(**_time_config, **_region_config, model_config=model_cfg, catalog=_cat)
+        self.assertEqual(["mock", "mock"], [i.name for i in exp.models])
+        mock_log.warning.assert_called_once_with("Warning: Model {'mock'} is repeated")
+
+    def test_load_yaml_cached(self):
+        cfg_a = _load_yaml_cached(_model_cfg)
+        cfg_b = _load_yaml_cached(_model_cfg)
+        self.assertEqual(cfg_a, cfg_b)
+        self.assertIsNot(cfg_a, cfg_b)
+
     def test_stage_models(self):
         exp = Experiment(
             **_time_config, **_region_config, model_config=_model_cfg, catalog=_cat
@@ -144,6 +297,16 @@ class TestExperiment(TestCase):
         dbpath = os.path.relpath(os.path.join(_dir, "../artifacts", "models", "model.hdf5"))
         self.assertEqual(exp.models[0].registry.database, dbpath)
 
+    def test_run_max_workers(self):
+        exp = Experiment(**_time_config, **_region_config, catalog=_cat, max_workers=3)
+        exp.task_graph = MagicMock()
+        exp.registry = MagicMock()
+
+        exp.run()
+        exp.task_graph.run.assert_called_once_with(max_workers=3)
+        exp.run(max_workers=2)
+        exp.task_graph.run.assert_called_with(max_workers=2)
+
     def test_set_tests(self):
         test_cfg = os.path.normpath(
             os.path.join(_dir, "../artifacts", "evaluations", "tests_cfg.yml")
@@ -176,6 +339,22 @@ class TestExperiment(TestCase):
             #     cat = CSEPCatalog.load_json(file_.name)
             #     numpy.testing.assert_equal(1609455600000, cat.data[0][1])
 
+    def test_compare_files(self):
+        with tempfile.TemporaryDirectory() as dir_:
+            paths = [os.path.join(dir_, f"{i}.json") for i in "abc"]
+            for path, content in zip(paths, [b"{1}", b"{1}", b"{2}"]):
+                with open(path, "wb") as f_:
+                    f_.write(content)
+
+            self.assertEqual(
+                ExperimentComparison.compare_files(paths[0], paths[1]),
+                {"hash": True, "byte2byte": True},
+            )
+            self.assertEqual(
+                ExperimentComparison.compare_files(paths[0], paths[2]),
+                {"hash": False, "byte2byte": False},
+            )
+
     @classmethod
     def tearDownClass(cls) -> None:
         path_ = os.path.join(_dir, "../artifacts", "models", "model.hdf5")
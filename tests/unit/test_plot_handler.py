@@ -6,16 +6,14 @@ import floatcsep.postprocess.plot_handler as plot_handler
 class TestPlotHandler(unittest.TestCase):
 
     @patch("matplotlib.pyplot.savefig")
-    @patch("floatcsep.postprocess.plot_handler.timewindow2str")
-    def test_plot_results(self, mock_timewindow2str, mock_savefig):
+    def test_plot_results(self, mock_savefig):
         mock_experiment = MagicMock()
         mock_test = MagicMock()
         mock_experiment.tests = [mock_test]
-        mock_timewindow2str.return_value = ["2021-01-01", "2021-12-31"]
+        mock_experiment._tw_strs = ["2021-01-01", "2021-12-31"]
 
         plot_handler.plot_results(mock_experiment)
 
-        mock_timewindow2str.assert_called_once_with(mock_experiment.timewindows)
         mock_test.plot_results.assert_called_once_with(
             ["2021-01-01", "2021-12-31"], mock_experiment.models, mock_experiment.registry
         )
@@ -27,6 +25,7 @@ class TestPlotHandler(unittest.TestCase):
         mock_experiment = MagicMock()
         mock_model = MagicMock()
         mock_experiment.models = [mock_model]
+        mock_experiment._tw_strs = ["2020-01-01_2021-01-01"]
         mock_parse_plot_config.return_value = {"projection": "Mercator"}
         mock_parse_projection.return_value = MagicMock()
         mock_experiment.postprocess.get.return_value = True
@@ -41,11 +40,12 @@ class TestPlotHandler(unittest.TestCase):
         # Verify that pyplot.savefig was called to save the plot
         mock_savefig.assert_called()
 
+    @patch("matplotlib.pyplot.close")
     @patch("matplotlib.pyplot.Figure.savefig")  # Mocking savefig on the Figure object
     @patch("floatcsep.postprocess.plot_handler.parse_plot_config")
     @patch("floatcsep.postprocess.plot_handler.parse_projection")
     def test_plot_catalogs(
-        self, mock_parse_projection, mock_parse_plot_config, mock_savefig
+        self, mock_parse_projection, mock_parse_plot_config, mock_savefig, mock_close
     ):
         # Mock the experiment and its components
         mock_experiment = MagicMock()
@@ -80,14 +80,18 @@ class TestPlotHandler(unittest.TestCase):
         )
 
         mock_savefig.assert_called()
+        mock_close.assert_any_call(mock_figure)
 
+    @patch("os.stat")
     @patch("os.path.isfile", return_value=True)
-    @patch("os.path.realpath", return_value="dir")
+    @patch("os.path.realpath", side_effect=lambda path: path)
     @patch("os.path.dirname", return_value="dir")
     @patch("importlib.util.spec_from_file_location")
     @patch("importlib.util.module_from_spec")
     def test_plot_custom(self, mock_module_from_spec, mock_spec_from_file_location,
-                         mock_dirname, mock_realpath, mock_isfile):
+                         mock_dirname, mock_realpath, mock_isfile, mock_stat):
+        plot_handler._SCRIPT_CACHE.clear()
+        mock_stat.return_value = MagicMock(st_mtime_ns=0, st_size=0)
         mock_experiment = MagicMock()
         mock_spec = MagicMock()
         mock_module = MagicMock()
@@ -105,6 +109,11 @@ class TestPlotHandler(unittest.TestCase):
         mock_module_from_spec.assert_called_once_with(mock_spec)
         mock_func.assert_called_once_with(mock_experiment)
 
+        # The unmodified script is not executed again
+        plot_handler.plot_custom(mock_experiment)
+        mock_spec.loader.exec_module.assert_called_once_with(mock_module)
+        self.assertEqual(mock_func.call_count, 2)
+
     def test_parse_plot_config(self):
         # Test True case
         result = plot_handler.parse_plot_config(True)
@@ -132,6 +141,7 @@ class TestPlotHandler(unittest.TestCase):
         mock_config = {"Mercator": {"central_longitude": 0.0}}
         result = plot_handler.parse_projection(mock_config)
         self.assertEqual(result.__class__.__name__, "Mercator")
+        self.assertIs(result, plot_handler.parse_projection(mock_config))
 
         # Test invalid projection case
         result = plot_handler.parse_projection("InvalidProjection")
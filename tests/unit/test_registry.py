@@ -1,7 +1,10 @@
+import logging
+import os
+import tempfile
 import unittest
 from datetime import datetime
 from unittest.mock import patch, MagicMock
-from floatcsep.infrastructure.registries import ForecastRegistry
+from floatcsep.infrastructure.registries import ForecastRegistry, ExperimentRegistry
 
 
 class TestForecastRegistry(unittest.TestCase):
@@ -37,6 +40,16 @@ class TestForecastRegistry(unittest.TestCase):
         self.assertEqual(self.registry_file._parse_arg("arg"), "arg")
         self.assertRaises(Exception, self.registry_file._parse_arg, 123)
 
+    def test_lookup(self):
+        tree = {"2023-01-01_2023-01-02": {"model": "forecast.csv"}}
+        window = [datetime(2023, 1, 1), datetime(2023, 1, 2)]
+        model = MagicMock()
+        model.name = "model"
+        self.assertEqual(
+            self.registry_file._lookup(tree, ("2023-01-01_2023-01-02", "model")), "forecast.csv"
+        )
+        self.assertEqual(self.registry_file._lookup(tree, (window, model)), "forecast.csv")
+
     def test_as_dict(self):
         self.assertEqual(
             self.registry_file.as_dict(),
@@ -58,12 +71,38 @@ class TestForecastRegistry(unittest.TestCase):
         result = self.registry_file.abs_dir("model.txt")
         self.assertTrue(result.endswith("/test/workdir"))
 
+    def test_abs_cached(self):
+        result = self.registry_file.abs("model", "file.txt")
+        self.assertIs(self.registry_file.abs("model", "file.txt"), result)
+        self.assertEqual(self.registry_file.rel("model", "file.txt"), "model/file.txt")
+
+        self.registry_file.workdir = "/test/other"
+        self.assertEqual(
+            self.registry_file.abs("model", "file.txt"), "/test/other/model/file.txt"
+        )
+
     @patch("floatcsep.infrastructure.registries.exists")
     def test_fileexists(self, mock_exists):
         mock_exists.return_value = True
         self.registry_file.get = MagicMock(return_value="/test/path/file.txt")
         self.assertTrue(self.registry_file.file_exists("file.txt"))
 
+    @patch("floatcsep.infrastructure.registries.exists")
+    def test_forecast_exists(self, mock_exists):
+        mock_exists.side_effect = lambda path: path.endswith("2023-01-01_2023-01-02.csv")
+        self.registry_file.forecasts = {
+            "2023-01-01_2023-01-02": "forecasts/model_2023-01-01_2023-01-02.csv",
+            "2023-01-02_2023-01-03": "forecasts/model_2023-01-02_2023-01-03.csv",
+        }
+        self.assertTrue(self.registry_file.forecast_exists("2023-01-01_2023-01-02"))
+        self.assertEqual(
+            self.registry_file.forecast_exists(
+                ["2023-01-01_2023-01-02", "2023-01-02_2023-01-03"]
+            ),
+            [True, False],
+        )
+        mock_exists.assert_any_call("/test/workdir/forecasts/model_2023-01-02_2023-01-03.csv")
+
     @patch("os.makedirs")
     @patch("os.listdir")
     def test_build_tree_time_independent(self, mock_listdir, mock_makedirs):
@@ -90,6 +129,113 @@ class TestForecastRegistry(unittest.TestCase):
         self.assertIn("2023-01-02_2023-01-03", self.registry_folder.forecasts)
         # self.assertTrue(self.registry_folder.inventory["2023-01-02_2023-01-03"])
 
+    @patch("floatcsep.infrastructure.registries.log")
+    def test_log_tree(self, mock_log):
+        mock_log.handlers = [logging.NullHandler()]
+        with tempfile.TemporaryDirectory() as workdir:
+            registry = ForecastRegistry(workdir=workdir, path="model")
+            timewindows = [
+                [datetime(2023, 1, 1), datetime(2023, 1, 2)],
+                [datetime(2023, 1, 2), datetime(2023, 1, 3)],
+            ]
+            registry.build_tree(
+                timewindows=timewindows, model_class="TimeDependentModel", prefix="forecast"
+            )
+            with open(registry.get_forecast("2023-01-01_2023-01-02"), "w"):
+                pass
+
+            registry.log_tree()
+            mock_log.debug.assert_any_call("    Existing forecasts: 1")
+            mock_log.debug.assert_any_call("    Missing forecasts: 1")
+            mock_log.debug.assert_any_call("      Time Window: 2023-01-02_2023-01-03")
+
+    @patch("floatcsep.infrastructure.registries.log")
+    def test_log_tree_disabled(self, mock_log):
+        mock_log.isEnabledFor.return_value = False
+        self.registry_file._list_folder = MagicMock()
+        self.registry_file.forecasts = {"2023-01-01_2023-01-02": "model.txt"}
+
+        self.registry_file.log_tree()
+        self.registry_file._list_folder.assert_not_called()
+        mock_log.debug.assert_not_called()
+
+    def test_log_tree_console_only(self):
+        # as set up by setup_logger: the logger is at DEBUG, but the console handler at INFO
+        logger = logging.getLogger("floatLogger.test_log_tree_console_only")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        console = logging.StreamHandler()
+        console.setLevel(logging.INFO)
+        logger.addHandler(console)
+        self.registry_file._list_folder = MagicMock()
+        self.registry_file.forecasts = {"2023-01-01_2023-01-02": "model.txt"}
+
+        # other tests may disable logging globally
+        disabled = logging.root.manager.disable
+        logging.disable(logging.NOTSET)
+        try:
+            with patch("floatcsep.infrastructure.registries.log", logger):
+                self.registry_file.log_tree()
+                self.registry_file._list_folder.assert_not_called()
+
+                # e.g., the experiment log file
+                logger.addHandler(logging.NullHandler())
+                self.registry_file.log_tree()
+                self.registry_file._list_folder.assert_called()
+        finally:
+            logging.disable(disabled)
+
+
+class TestExperimentRegistry(unittest.TestCase):
+
+    @patch("floatcsep.infrastructure.registries.log")
+    def test_log_results_tree(self, mock_log):
+        mock_log.handlers = [logging.NullHandler()]
+        with tempfile.TemporaryDirectory() as workdir:
+            registry = ExperimentRegistry(workdir)
+            timewindows = [[datetime(2023, 1, 1), datetime(2023, 1, 2)]]
+            models = [MagicMock(), MagicMock()]
+            models[0].name, models[1].name = "model_a", "model_b"
+            test = MagicMock()
+            test.name = "test_a"
+            registry.build_tree(timewindows, models, [test])
+            with open(registry.get_result("2023-01-01_2023-01-02", "test_a", "model_a"), "w"):
+                pass
+
+            registry.log_results_tree()
+            mock_log.debug.assert_any_call("Results that Exist: 1")
+            mock_log.debug.assert_any_call("Results that Do Not Exist: 1")
+
+    @patch("os.makedirs")
+    def test_build_tree_figures(self, mock_makedirs):
+        registry = ExperimentRegistry("/test/workdir")
+        timewindows = [
+            [datetime(2023, 1, 1), datetime(2023, 1, 2)],
+            [datetime(2023, 1, 2), datetime(2023, 1, 3)],
+        ]
+        model = MagicMock()
+        model.name = "model_a"
+        test = MagicMock()
+        test.name = "test_a"
+        registry.build_tree(timewindows, [model], [test])
+
+        # window figures are only built when accessed
+        self.assertNotIn("2023-01-01_2023-01-02", registry.figures)
+        self.assertEqual(
+            registry.get_figure("2023-01-01_2023-01-02", "forecasts", "model_a"),
+            "/test/workdir/results/2023-01-01_2023-01-02/figures/forecast_model_a",
+        )
+        self.assertEqual(
+            registry.get_figure("2023-01-02_2023-01-03", "test_a"),
+            "/test/workdir/results/2023-01-02_2023-01-03/figures/test_a",
+        )
+        self.assertEqual(
+            registry.get_figure("main_catalog_map"), "/test/workdir/results/catalog"
+        )
+        self.assertIn("catalog_time", registry.figures["2023-01-01_2023-01-02"])
+        with self.assertRaises(KeyError):
+            registry.get_figure("2023-01-03_2023-01-04", "test_a")
+
 
 if __name__ == "__main__":
     unittest.main()
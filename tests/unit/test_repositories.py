@@ -1,8 +1,15 @@
 import datetime
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch, PropertyMock, mock_open
 
+import numpy
+from csep.core.catalogs import CSEPCatalog
 from csep.core.forecasts import GriddedForecast
+from csep.core.regions import CartesianGrid2D
+from csep.utils.time_utils import decimal_year
 
 from floatcsep.utils.readers import ForecastParsers
 from floatcsep.infrastructure.registries import ForecastRegistry
@@ -11,6 +18,7 @@ from floatcsep.infrastructure.repositories import (
     GriddedForecastRepository,
     ResultsRepository,
     CatalogRepository,
+    _write_catalog_json,
 )
 
 
@@ -97,13 +105,11 @@ class TestGriddedForecastRepository(unittest.TestCase):
 
     @patch.object(GriddedForecast, "__init__", return_value=None)
     @patch.object(GriddedForecast, "event_count", new_callable=PropertyMock)
-    @patch.object(GriddedForecast, "scale")
     @patch.object(ForecastParsers, "hdf5")
-    def test_load_single_forecast(self, mock_parser, mock_scale, mock_count, mock_init):
+    def test_load_single_forecast(self, mock_parser, mock_count, mock_init):
         # Mock parser return values
         mock_count.return_value = 2
         mock_parser.return_value = ("rates", "region", "mags")
-        mock_scale.return_value = mock_scale
 
         # Test _load_single_forecast
         repo = GriddedForecastRepository(self.registry, lazy_load=False)
@@ -119,6 +125,22 @@ class TestGriddedForecastRepository(unittest.TestCase):
                 end_time=datetime.datetime(2024, 1, 1),
             )
 
+    @patch.object(ForecastParsers, "hdf5")
+    def test_load_single_forecast_scaled(self, mock_parser):
+        rates = numpy.ones((2, 3))
+        region = CartesianGrid2D.from_origins(numpy.array([[0.0, 0.0], [0.1, 0.0]]), dh=0.1)
+        mock_parser.return_value = (rates, region, numpy.array([4.0, 4.1, 4.2]))
+
+        repo = GriddedForecastRepository(self.registry, lazy_load=False)
+        forecast = repo._load_single_forecast("2023-01-01_2023-07-02", 1, "axe")
+
+        scale = decimal_year(datetime.datetime(2023, 7, 2)) - decimal_year(
+            datetime.datetime(2023, 1, 1)
+        )
+        numpy.testing.assert_allclose(forecast.data, scale)
+        self.assertIs(forecast._data, rates)
+        self.assertEqual(forecast._scale, 1)
+
     @patch.object(ForecastParsers, "hdf5")
     def test_lazy_load_behavior(self, mock_parser):
         mock_parser.return_value = ("rates", "region", "mags")
@@ -168,17 +190,50 @@ class TestResultsRepository(unittest.TestCase):
     def test_initialization(self):
         self.assertEqual(self.results_repo.registry, self.mock_registry)
 
+    @patch("os.stat")
     @patch("floatcsep.infrastructure.repositories.EvaluationResult.from_dict")
     @patch("builtins.open", new_callable=unittest.mock.mock_open, read_data='{"key": "value"}')
-    def test_load_result(self, mock_open, mock_from_dict):
+    def test_load_result(self, mock_open, mock_from_dict, mock_stat):
         mock_from_dict.return_value = "mocked_result"
         result = self.results_repo._load_result("test", "window", "model")
         self.assertEqual(result, "mocked_result")
 
-    @patch.object(ResultsRepository, "_load_result", return_value="mocked_result")
-    def test_load_results(self, mock_load_result):
-        results = self.results_repo.load_results("test", "window", ["model1", "model2"])
-        self.assertEqual(results, ["mocked_result", "mocked_result"])
+        # A second read of the unmodified file is served from the cache
+        self.results_repo._load_result("test", "window", "model")
+        mock_open.assert_called_once()
+
+    @patch("floatcsep.infrastructure.repositories.EvaluationResult.from_dict")
+    def test_load_result_nan(self, mock_from_dict):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            eval_path = os.path.join(tmpdir, "test_model.json")
+            with open(eval_path, "w") as file_:
+                json.dump({"observed_statistic": float("nan"), "quantile": 0.5}, file_)
+            self.mock_registry.get_result.return_value = eval_path
+            self.results_repo._load_result("test", "window", "model")
+
+        result_dict = mock_from_dict.call_args[0][0]
+        self.assertTrue(numpy.isnan(result_dict["observed_statistic"]))
+        self.assertEqual(result_dict["quantile"], 0.5)
+
+    @patch("floatcsep.infrastructure.repositories.EvaluationResult.from_dict")
+    def test_load_results(self, mock_from_dict):
+        mock_from_dict.side_effect = lambda result_dict: result_dict["name"]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = {}
+            for model in ["model1", "model2"]:
+                paths[model] = os.path.join(tmpdir, f"{model}.json")
+                with open(paths[model], "w") as file_:
+                    json.dump({"name": model}, file_)
+            self.mock_registry.get_result.side_effect = lambda w, t, model: paths[model]
+
+            results = self.results_repo.load_results("test", "window", ["model1", "model2"])
+            self.assertEqual(results, ["model1", "model2"])
+
+            # Cached results are returned without starting a thread pool
+            with patch("floatcsep.infrastructure.repositories.ThreadPoolExecutor") as mock_pool:
+                results = self.results_repo.load_results("test", "window", ["model1", "model2"])
+            mock_pool.assert_not_called()
+            self.assertEqual(results, ["model1", "model2"])
 
     @patch("json.dump")
     @patch("builtins.open", new_callable=unittest.mock.mock_open)
@@ -212,6 +267,130 @@ class TestCatalogRepository(unittest.TestCase):
         # Check if _catalog is set correctly
         self.assertEqual(self.catalog_repo._catalog, "catalog_path")
 
+    @patch("floatcsep.infrastructure.repositories._write_catalog_json")
+    def test_catalog_query_bounds(self, mock_write):
+        mock_query = MagicMock()
+        self.catalog_repo._catalog = mock_query
+        self.catalog_repo.cat_path = "/nonexistent/catalog.json"
+        self.catalog_repo.time_config = {
+            "timewindows": [
+                (datetime.datetime(2020, 1, 1), datetime.datetime(2020, 6, 1, 12, 30)),
+                (datetime.datetime(2020, 6, 1, 12, 30), datetime.datetime(2021, 1, 1)),
+            ]
+        }
+        self.catalog_repo.region_config = {
+            "magnitudes": numpy.array([4.0, 4.1]),
+            "depths": numpy.array([0.0, 30.0]),
+            "region": None,
+        }
+
+        _ = self.catalog_repo.catalog
+        mock_query.assert_called_once_with(
+            catalog_id="catalog",
+            start_time=datetime.datetime(2020, 1, 1),
+            end_time=datetime.datetime(2021, 1, 1),
+            min_magnitude=4.0,
+            max_depth=30.0,
+        )
+
+    def test_filter_window(self):
+        cat_path = os.path.join(os.path.dirname(__file__), "../artifacts", "catalog.json")
+        catalog = CSEPCatalog.load_json(cat_path)
+        self.catalog_repo.set_main_catalog(
+            None, {}, {"mag_min": 3.0, "mag_max": 9.0, "region": None}
+        )
+        start = datetime.datetime(2020, 1, 1)
+        end = datetime.datetime(2021, 1, 1)
+
+        sub_cat = self.catalog_repo._filter_window(catalog, start, end)
+        expected = catalog.filter(
+            [
+                f"origin_time < {end.timestamp() * 1000}",
+                f"origin_time >= {start.timestamp() * 1000}",
+                "magnitude >= 3.0",
+                "magnitude < 9.0",
+            ],
+            in_place=False,
+        )
+        self.assertEqual(sub_cat.get_number_of_events(), expected.get_number_of_events())
+        self.assertEqual(sub_cat.filters, expected.filters)
+
+    def test_filter_window_region(self):
+        cat_path = os.path.join(os.path.dirname(__file__), "../artifacts", "catalog.json")
+        catalog = CSEPCatalog.load_json(cat_path)
+        region = CartesianGrid2D.from_origins(numpy.array([[0.0, 0.0], [1.0, 1.0]]), dh=0.1)
+        self.catalog_repo.set_main_catalog(
+            None, {}, {"mag_min": 3.0, "mag_max": 9.0, "region": region}
+        )
+        start = datetime.datetime(2020, 1, 1)
+        end = datetime.datetime(2021, 1, 1)
+
+        sub_cat = self.catalog_repo._filter_window(catalog, start, end)
+        expected = catalog.filter(
+            [
+                f"origin_time < {end.timestamp() * 1000}",
+                f"origin_time >= {start.timestamp() * 1000}",
+            ],
+            in_place=False,
+        ).filter_spatial(region=region, in_place=False)
+        numpy.testing.assert_array_equal(sub_cat.catalog, expected.catalog)
+        self.assertIs(sub_cat.region, region)
+
+        mask = self.catalog_repo._region_mask
+        self.catalog_repo._filter_window(catalog, start, end)
+        self.assertIs(self.catalog_repo._region_mask, mask)
+
+    def test_write_catalog_json(self):
+        cat_path = os.path.join(os.path.dirname(__file__), "../artifacts", "catalog.json")
+        catalog = CSEPCatalog.load_json(cat_path)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            expected_path = os.path.join(tmp_dir, "expected.json")
+            result_path = os.path.join(tmp_dir, "result.json")
+            catalog.write_json(expected_path)
+            _write_catalog_json(catalog, result_path)
+            expected = CSEPCatalog.load_json(expected_path)
+            result = CSEPCatalog.load_json(result_path)
+
+        numpy.testing.assert_array_equal(result.catalog, expected.catalog)
+        self.assertEqual(result.start_time, expected.start_time)
+        self.assertEqual(result.filters, expected.filters)
+
+    @patch("floatcsep.infrastructure.repositories.CSEPCatalog.load_json")
+    def test_catalog_cached(self, mock_load_json):
+        cat_path = os.path.join(os.path.dirname(__file__), "../artifacts", "catalog.json")
+        self.mock_registry.abs.return_value = cat_path
+        self.catalog_repo._catalog = cat_path
+        self.catalog_repo.cat_path = cat_path
+
+        catalog = self.catalog_repo.catalog
+        self.assertIs(catalog, self.catalog_repo.catalog)
+        mock_load_json.assert_called_once_with(cat_path)
+
+        self.catalog_repo.catalog = None
+        self.assertIsNone(self.catalog_repo._cached_catalog)
+
+    def test_get_test_cat_cached(self):
+        cat_path = os.path.join(os.path.dirname(__file__), "../artifacts", "catalog.json")
+        catalog = CSEPCatalog.load_json(cat_path)
+        self.catalog_repo.region_config = {"mag_min": 3.0, "mag_max": 9.0, "region": None}
+        tstring = "2020-01-01_2021-01-01"
+
+        with patch.object(
+            CatalogRepository, "catalog", new_callable=PropertyMock, return_value=catalog
+        ):
+            with patch.object(
+                self.catalog_repo, "_filter_window", wraps=self.catalog_repo._filter_window
+            ) as mock_filter:
+                cat_a = self.catalog_repo.get_test_cat(tstring)
+                cat_a.region = "forecast_region"
+                cat_b = self.catalog_repo.get_test_cat(tstring)
+
+        mock_filter.assert_called_once()
+        self.assertIsNot(cat_a, cat_b)
+        self.assertIs(cat_a.catalog, cat_b.catalog)
+        self.assertIs(cat_b.region, catalog.region)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import os.path
 import unittest
 import numpy
+import yaml
 from datetime import datetime
 
 import csep
@@ -16,6 +17,12 @@ from floatcsep.utils.helpers import (
     read_region_cfg,
     parse_csep_func,
     timewindows_td,
+    _offset_windows,
+    parse_nested_dicts,
+    NoAliasDumper,
+    NoAliasLoader,
+    _load_region,
+    _REGION_CACHE_SIZE,
 )
 
 root_dir = os.path.dirname(os.path.abspath(__file__))
@@ -44,6 +51,70 @@ class CsepFunctionTest(unittest.TestCase):
         self.assertRaises(AttributeError, parse_csep_func, "panic_button")
 
 
+class SerializationUtilsTest(unittest.TestCase):
+
+    def test_parse_nested_dicts(self):
+        shared = [numpy.array([1.0, 2.0]), {"func": numpy.sum}]
+        parsed = parse_nested_dicts({"a": shared, "b": {"c": shared}, "d": "text"})
+
+        self.assertEqual(
+            parsed,
+            {
+                "a": [[1.0, 2.0], {"func": "sum"}],
+                "b": {"c": [[1.0, 2.0], {"func": "sum"}]},
+                "d": "text",
+            },
+        )
+        self.assertIs(parsed["a"], parsed["b"]["c"])
+
+    def test_parse_nested_dicts_deep(self):
+        nested = leaf = {}
+        for _ in range(5000):
+            leaf["z"] = {}
+            leaf["a"] = (1, 2)
+            leaf = leaf["z"]
+        parsed = parse_nested_dicts(nested)
+
+        self.assertEqual(list(parsed), ["z", "a"])
+        self.assertEqual(parsed["a"], [1, 2])
+        for _ in range(5000):
+            parsed = parsed["z"]
+        self.assertEqual(parsed, {})
+
+    def test_yaml_numpy_scalars(self):
+        dict_ = {"mag_min": numpy.float64(3.0), "intervals": numpy.int64(12)}
+        dumped = yaml.dump(parse_nested_dicts(dict_), Dumper=NoAliasDumper)
+        loaded = yaml.load(dumped, NoAliasLoader)
+
+        self.assertEqual(loaded, {"mag_min": 3.0, "intervals": 12})
+        self.assertIs(type(loaded["intervals"]), int)
+
+    def test_yaml_legacy_python_tags(self):
+        # repr_config.yml as written by former versions, with the full python representers
+        legacy = (
+            "name: experiment\n"
+            "models:\n"
+            "- pymock:\n"
+            "   func: pymock\n"
+            "   environment: !!python/object:"
+            "floatcsep.infrastructure.environments.VenvManager\n"
+            "    base_name: pymock\n"
+            "    model_directory: /path/to/pymock\n"
+            "   path: pymock\n"
+            "region_config:\n"
+            " depths: !!python/tuple\n"
+            " - 0\n"
+            " - 70\n"
+        )
+        loaded = yaml.load(legacy, NoAliasLoader)
+
+        self.assertEqual(
+            loaded["models"],
+            [{"pymock": {"func": "pymock", "environment": None, "path": "pymock"}}],
+        )
+        self.assertEqual(loaded["region_config"]["depths"], (0, 70))
+
+
 class TimeUtilsTest(unittest.TestCase):
 
     def test_parse_time_window(self):
@@ -187,12 +258,40 @@ class TimeUtilsTest(unittest.TestCase):
             ],
         )
 
+    def test_timewindows_td_empty(self):
+        start = datetime(2020, 1, 1)
+        for end in (start, datetime(2019, 12, 31)):
+            self.assertEqual(
+                timewindows_td(
+                    start_date=start, end_date=end, timehorizon="1-days", timeoffset="1-days"
+                ),
+                [],
+            )
+        self.assertEqual(
+            _offset_windows(start, "1D", "1D", intervals=0),
+            [],
+        )
+        # the first offset start falls past the end date, but start_date opens a window
+        self.assertEqual(
+            timewindows_td(
+                start_date=datetime(2010, 6, 12),
+                end_date=datetime(2010, 9, 12),
+                timehorizon="1-days",
+                timeoffset="5-years",
+            ),
+            [
+                (datetime(2010, 6, 12), datetime(2010, 6, 13)),
+                (datetime(2016, 1, 1), datetime(2016, 1, 2)),
+            ],
+        )
+
     def test_read_time_config(self):
         start = datetime(2014, 1, 1)
         end = datetime(2022, 1, 1)
         intervals = 2
         config = {"start_date": start, "end_date": end, "intervals": intervals}
         self.assertEqual(read_time_cfg(None, **config), read_time_cfg(config))
+        self.assertEqual(config, {"start_date": start, "end_date": end, "intervals": intervals})
 
         short_config = {"start_date": start, "end_date": end}
         time_config = {"intervals": 2}
@@ -257,3 +356,32 @@ class RegionUtilsTest(unittest.TestCase):
         midpoints = numpy.genfromtxt(region_path)
         region_config = read_region_cfg(config)
         numpy.testing.assert_almost_equal(midpoints, region_config["region"].midpoints())
+
+    def test_region_dict(self):
+        region_dict = {"name": "mock", "dh": 0.1, "polygons": [{"lon": 0.0, "lat": 0.0}]}
+        config = {"region": region_dict, "mag_min": 1, "mag_max": 1.2, "mag_bin": 0.1}
+
+        region_config = read_region_cfg(config)
+        numpy.testing.assert_almost_equal(region_config["region"].magnitudes, [1.0, 1.1, 1.2])
+        # the input configuration is not modified
+        self.assertNotIn("magnitudes", region_dict)
+        self.assertNotIn("depths", config)
+
+    def test_region_cached(self):
+        region_path = os.path.join(
+            os.path.dirname(__file__), "../artifacts", "regions", "mock_region"
+        )
+        config = {"region": region_path, "mag_min": 1, "mag_max": 1.2, "mag_bin": 0.1}
+
+        region_a = read_region_cfg(config)["region"]
+        region_b = read_region_cfg(config)["region"]
+        self.assertIsNot(region_a, region_b)
+        self.assertIs(region_a.bbox_mask, region_b.bbox_mask)
+
+        # different magnitudes build a new region
+        region_c = read_region_cfg({**config, "mag_max": 1.3})["region"]
+        self.assertIsNot(region_a.bbox_mask, region_c.bbox_mask)
+        numpy.testing.assert_almost_equal(region_c.magnitudes, [1.0, 1.1, 1.2, 1.3])
+
+        # built regions are evicted beyond the cache size
+        self.assertEqual(_load_region.cache_info().maxsize, _REGION_CACHE_SIZE)